@@ -6,15 +6,21 @@ set -o nounset
 
 readonly GUNICORN='/venv/bin/gunicorn'
 readonly GUNICORN_WORKERS=${GUNICORN_WORKERS:-4}
+# Requests proxied to pulp mostly wait on network I/O, each worker serves
+# up to GUNICORN_THREADS of them concurrently.
+readonly GUNICORN_THREADS=${GUNICORN_THREADS:-16}
 
 readonly BIND_HOST='0.0.0.0'
 readonly BIND_PORT=8000
+readonly WORKER_CLASS='gthread'
 readonly APP_MODULE='pulpcore.app.wsgi:application'
 
 
 exec "${GUNICORN}" \
   --bind "${BIND_HOST}:${BIND_PORT}" \
+  --worker-class "${WORKER_CLASS}" \
   --workers "${GUNICORN_WORKERS}" \
+  --threads "${GUNICORN_THREADS}" \
   --access-logfile - \
   --reload \
   "${APP_MODULE}"
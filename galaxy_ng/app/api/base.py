@@ -21,12 +21,17 @@ GALAXY_PAGINATION_CLASS = perform_import(
     settings.GALAXY_PAGINATION_CLASS,
     'GALAXY_PAGINATION_CLASS'
 )
+GALAXY_RENDERER_CLASSES = perform_import(
+    settings.GALAXY_RENDERER_CLASSES,
+    'GALAXY_RENDERER_CLASSES'
+)
 
 
 class LocalSettingsMixin:
     authentication_classes = GALAXY_AUTHENTICATION_CLASSES
     permission_classes = GALAXY_PERMISSION_CLASSES
     pagination_class = GALAXY_PAGINATION_CLASS
+    renderer_classes = GALAXY_RENDERER_CLASSES
 
     def get_exception_handler(self):
         return GALAXY_EXCEPTION_HANDLER
@@ -0,0 +1,103 @@
+import functools
+import hashlib
+import time
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from galaxy_ng.app.common import cache
+
+
+__all__ = (
+    'cache_headers',
+    'conditional_get',
+)
+
+
+def _get_validators(request, scope):
+    """
+    Computes ETag and Last-Modified validators of a proxied resource.
+
+    Validators are derived from the content version of a cache scope
+    and the requested representation, so no request to pulp is needed.
+    Content version is local to a process unless the cache backend is
+    shared, so validators also change every GALAXY_CONDITIONAL_GET_MAX_AGE
+    seconds to bound how long a stale representation can be revalidated.
+    """
+    version = cache.get_version(scope)
+    last_modified = version // 10 ** 9
+
+    max_age = settings.GALAXY_CONDITIONAL_GET_MAX_AGE
+    period = 0
+    if max_age:
+        period = int(time.time()) // max_age * max_age
+        last_modified = max(last_modified, period)
+
+    representation = '\n'.join((
+        str(version),
+        str(period),
+        request.build_absolute_uri(),
+        request.META.get('HTTP_ACCEPT', ''),
+    ))
+    etag = quote_etag(hashlib.sha1(representation.encode('utf-8')).hexdigest())
+    return etag, last_modified
+
+
+def conditional_get(scope):
+    """
+    Decorates viewset method with conditional GET support.
+
+    Responses are given ETag and Last-Modified headers, and requests with
+    matching If-None-Match or If-Modified-Since headers are answered with
+    304 Not Modified without calling the method.
+
+    Enabled by GALAXY_CONDITIONAL_GET setting.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            if not settings.GALAXY_CONDITIONAL_GET or request.method not in ('GET', 'HEAD'):
+                return func(self, request, *args, **kwargs)
+
+            etag, last_modified = _get_validators(request, scope)
+            response = get_conditional_response(
+                request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = func(self, request, *args, **kwargs)
+
+            if response.status_code in (200, 304):
+                response['ETag'] = etag
+                response['Last-Modified'] = http_date(last_modified)
+            return response
+        return wrapper
+    return decorator
+
+
+def cache_headers(endpoint, surrogate_key_args):
+    """
+    Decorates viewset method with caching proxy headers.
+
+    Successful responses are given Cache-Control header configured for
+    the endpoint in GALAXY_CACHE_CONTROL setting and surrogate keys header
+    named by GALAXY_SURROGATE_KEY_HEADER setting. Surrogate keys are built
+    from view kwargs listed in ``surrogate_key_args``.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            response = func(self, request, *args, **kwargs)
+            if response.status_code not in (200, 304):
+                return response
+
+            cache_control = settings.GALAXY_CACHE_CONTROL.get(endpoint)
+            if cache_control:
+                response['Cache-Control'] = cache_control
+
+            if settings.GALAXY_SURROGATE_KEY_HEADER:
+                keys = cache.get_surrogate_keys(
+                    *(self.kwargs[arg] for arg in surrogate_key_args))
+                response[settings.GALAXY_SURROGATE_KEY_HEADER] = ' '.join(keys)
+            return response
+        return wrapper
+    return decorator
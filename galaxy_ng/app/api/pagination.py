@@ -1,11 +1,83 @@
+import json
+
+from django.conf import settings
+from django.core import signing
+from django.db import connections
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class LimitOffsetPagination(pagination.LimitOffsetPagination):
+    """
+    Limit/offset pagination with opt-in cursor mode.
+
+    Requests with ``cursor`` query parameter (empty for the first page)
+    are paginated by CursorPagination instead.
+
+    Counting of local querysets is controlled by ``count_mode`` query
+    parameter, defaulting to GALAXY_PAGINATION_COUNT_MODE setting:
+
+    * ``exact`` - counts all rows.
+    * ``estimate`` - returns row count estimated by database planner.
+    * ``none`` - returns no count.
+
+    Without exact count, the next page is detected by fetching one extra
+    row and the last page link is omitted.
+    """
+
     default_limit = 10
     max_limit = 100
+    cursor_query_param = 'cursor'
+    count_mode_query_param = 'count_mode'
+    count_modes = ('exact', 'estimate', 'none')
+
+    _cursor_paginator = None
+    _has_next = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param in request.query_params:
+            self._cursor_paginator = CursorPagination()
+            return self._cursor_paginator.paginate_queryset(queryset, request, view)
+
+        count_mode = self.get_count_mode(request)
+        if count_mode == 'exact':
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+        self.offset = self.get_offset(request)
+
+        page = list(queryset[self.offset:self.offset + self.limit + 1])
+        self._has_next = len(page) > self.limit
+        page = page[:self.limit]
+
+        if count_mode == 'estimate':
+            self.count = max(self._estimate_count(queryset), self.offset + len(page))
+        else:
+            self.count = None
+        return page
+
+    def get_count_mode(self, request):
+        count_mode = request.query_params.get(
+            self.count_mode_query_param, settings.GALAXY_PAGINATION_COUNT_MODE)
+        if count_mode not in self.count_modes:
+            return 'exact'
+        return count_mode
+
+    @staticmethod
+    def _estimate_count(queryset):
+        """Returns number of rows estimated by postgres query planner."""
+        sql, params = queryset.query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return plan[0]['Plan']['Plan Rows']
 
     def get_first_link(self):
         url = self.request.get_full_path()
@@ -14,6 +86,9 @@ class LimitOffsetPagination(pagination.LimitOffsetPagination):
         return replace_query_param(url, self.offset_query_param, 0)
 
     def get_last_link(self):
+        if self._has_next is not None:
+            return None
+
         url = self.request.get_full_path()
         url = replace_query_param(url, self.limit_query_param, self.limit)
 
@@ -21,7 +96,11 @@ class LimitOffsetPagination(pagination.LimitOffsetPagination):
         return replace_query_param(url, self.offset_query_param, offset)
 
     def get_next_link(self):
-        if self.offset + self.limit >= self.count:
+        if self._has_next is not None:
+            has_next = self._has_next
+        else:
+            has_next = self.offset + self.limit < self.count
+        if not has_next:
             return None
 
         url = self.request.get_full_path()
@@ -45,6 +124,8 @@ class LimitOffsetPagination(pagination.LimitOffsetPagination):
 
     def get_paginated_response(self, data):
         """Returns paginated response."""
+        if self._cursor_paginator is not None:
+            return self._cursor_paginator.get_paginated_response(data)
         return Response(
             {
                 "meta": {"count": self.count},
@@ -71,3 +152,77 @@ class LimitOffsetPagination(pagination.LimitOffsetPagination):
             self.display_page_controls = True
 
         return self.get_paginated_response(data)
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination with signed opaque cursors.
+
+    Pages are ordered by the view ``cursor_ordering`` attribute, which
+    should be a stable, preferably unique sort key. Cursors are signed, so
+    clients cannot forge positions.
+    """
+
+    page_size = LimitOffsetPagination.default_limit
+    page_size_query_param = LimitOffsetPagination.limit_query_param
+    max_page_size = LimitOffsetPagination.max_limit
+    ordering = '-pk'
+
+    signing_salt = 'galaxy_ng.app.api.pagination.CursorPagination'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page = super().paginate_queryset(queryset, request, view)
+        # Keep links relative as in LimitOffsetPagination
+        self.base_url = request.get_full_path()
+        return page
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, 'cursor_ordering', None) or self.ordering
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            tokens = signing.loads(encoded, salt=self.signing_salt)
+            offset = pagination._positive_int(tokens.get('o', 0), cutoff=self.offset_cutoff)
+            reverse = bool(tokens.get('r', False))
+            position = tokens.get('p')
+        except (signing.BadSignature, AttributeError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return pagination.Cursor(offset=offset, reverse=reverse, position=position)
+
+    def encode_cursor(self, cursor):
+        tokens = {}
+        if cursor.offset != 0:
+            tokens['o'] = cursor.offset
+        if cursor.reverse:
+            tokens['r'] = True
+        if cursor.position is not None:
+            tokens['p'] = cursor.position
+
+        encoded = signing.dumps(tokens, salt=self.signing_salt)
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_first_link(self):
+        return replace_query_param(self.base_url, self.cursor_query_param, '')
+
+    def get_paginated_response(self, data):
+        """Returns paginated response without count and last page link."""
+        return Response(
+            {
+                "meta": {},
+                "links": {
+                    "first": self.get_first_link(),
+                    "previous": self.get_previous_link(),
+                    "next": self.get_next_link(),
+                    "last": None,
+                },
+                "data": data,
+            }
+        )
@@ -1,53 +1,96 @@
+from django.conf import settings
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from galaxy_ng.app.common import cache
 from galaxy_ng.app.models import Namespace
-from galaxy_ng.app.models.auth import SYSTEM_SCOPE
+from galaxy_ng.app.models.auth import RH_PARTNER_ENGINEER_GROUP
+
+
+def get_group_names(request):
+    """
+    Returns a set of names of the groups the request user belongs to.
+
+    Names are loaded once per request. If GALAXY_GROUP_CACHE_TTL setting
+    is not zero, they are also cached across requests by user id.
+    """
+    group_names = getattr(request, '_galaxy_group_names', None)
+    if group_names is None:
+        group_names = _load_group_names(request.user)
+        request._galaxy_group_names = group_names
+    return group_names
+
+
+def _load_group_names(user):
+    if not user or not user.is_authenticated:
+        return frozenset()
+
+    if not settings.GALAXY_GROUP_CACHE_TTL:
+        return frozenset(user.groups.values_list('name', flat=True))
+
+    backend = cache.get_cache()
+    cache_key = f'galaxy:user-groups:{user.pk}'
+    group_names = backend.get(cache_key)
+    if group_names is None:
+        group_names = frozenset(user.groups.values_list('name', flat=True))
+        backend.set(cache_key, group_names, settings.GALAXY_GROUP_CACHE_TTL)
+    return group_names
+
+
+def is_partner_engineer(request):
+    """Checks if user is in partner engineers group."""
+    return RH_PARTNER_ENGINEER_GROUP in get_group_names(request)
+
+
+def is_namespace_owner(request, obj):
+    """Checks if user is in one of the namespace owners groups."""
+    group_names = get_group_names(request)
+    if not group_names:
+        return False
+
+    if isinstance(obj, Namespace):
+        namespace = obj
+    elif hasattr(obj, 'namespace'):
+        namespace = obj.namespace
+    else:
+        obj_type = type(obj).__name__
+        raise RuntimeError(
+            f"Object {obj_type} is not a Namespace and does"
+            f" not have \"namespace\" attribute. "
+        )
+
+    # NOTE: Iterating over all() uses prefetched groups if available
+    return any(group.name in group_names for group in namespace.groups.all())
 
 
 class IsPartnerEngineer(BasePermission):
     """Checks if user is in partner engineers group."""
 
-    GROUP_NAME = f'{SYSTEM_SCOPE}:partner-engineers'
+    GROUP_NAME = RH_PARTNER_ENGINEER_GROUP
 
     def has_permission(self, request, view):
-        if not request.user or not request.user.is_authenticated:
-            return False
-        return request.user.groups.filter(name=self.GROUP_NAME).exists()
+        return is_partner_engineer(request)
 
 
 class IsNamespaceOwner(BasePermission):
     """Checks if user is in namespace owners group."""
 
     def has_object_permission(self, request, view, obj):
-        if not request.user or not request.user.is_authenticated:
-            return False
-
-        if isinstance(obj, Namespace):
-            namespace = obj
-        elif hasattr(obj, 'namespace'):
-            namespace = obj.namespace
-        else:
-            obj_type = type(obj).__name__
-            raise RuntimeError(
-                f"Object {obj_type} is not a Namespace and does"
-                f" not have \"namespace\" attribute. "
-            )
-
-        return namespace.groups.filter(pk__in=request.user.groups.all()).exists()
+        return is_namespace_owner(request, obj)
 
 
 class IsNamespaceOwnerOrReadOnly(BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method in SAFE_METHODS:
             return True
-        return IsNamespaceOwner().has_object_permission(request, view, obj)
+        return is_namespace_owner(request, obj)
 
 
 class IsNamespaceOwnerOrPartnerEngineer(BasePermission):
     """Checks if user is owner of namespace or a partner engineer."""
 
     def has_object_permission(self, request, view, obj):
-        if IsPartnerEngineer().has_permission(request, view):
+        if is_partner_engineer(request):
+            return True
+        if request.method in SAFE_METHODS:
             return True
-        return IsNamespaceOwnerOrReadOnly().has_object_permission(
-            request, view, obj)
+        return is_namespace_owner(request, obj)
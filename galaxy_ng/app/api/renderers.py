@@ -0,0 +1,87 @@
+import json
+import re
+import uuid
+
+from rest_framework import renderers
+from rest_framework.compat import (
+    INDENT_SEPARATORS, LONG_SEPARATORS, SHORT_SEPARATORS
+)
+from rest_framework.utils import encoders
+
+
+__all__ = (
+    'RawJSON',
+    'JSONRenderer',
+)
+
+
+class RawJSON:
+    """
+    An already encoded JSON value.
+
+    JSONRenderer outputs raw JSON values as is, so JSON received from pulp
+    can be returned to the client without decoding and re-encoding it.
+    """
+
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+
+class _RawJSONEncoder(encoders.JSONEncoder):
+    """Encodes RawJSON values as placeholder strings."""
+
+    def __init__(self, *args, fragments, placeholder, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fragments = fragments
+        self.placeholder = placeholder
+
+    def default(self, obj):
+        if isinstance(obj, RawJSON):
+            self.fragments.append(obj.data)
+            return f'{self.placeholder}{len(self.fragments) - 1}'
+        return super().default(obj)
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    JSON renderer supporting RawJSON values.
+
+    RawJSON response data is returned as is. RawJSON values nested in
+    response data are encoded as placeholders which are then replaced
+    with raw values in the encoded document.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if isinstance(data, RawJSON):
+            return data.data
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+
+        if indent is None:
+            separators = SHORT_SEPARATORS if self.compact else LONG_SEPARATORS
+        else:
+            separators = INDENT_SEPARATORS
+
+        fragments = []
+        placeholder = f'__raw_json_{uuid.uuid4().hex}_'
+        ret = json.dumps(
+            data, cls=_RawJSONEncoder,
+            indent=indent, ensure_ascii=self.ensure_ascii,
+            allow_nan=not self.strict, separators=separators,
+            fragments=fragments, placeholder=placeholder,
+        )
+
+        # See rest_framework.renderers.JSONRenderer.render
+        ret = ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+        ret = ret.encode()
+
+        if fragments:
+            pattern = re.compile(b'"' + re.escape(placeholder.encode()) + rb'(\d+)"')
+            ret = pattern.sub(lambda match: fragments[int(match.group(1))], ret)
+        return ret
@@ -13,12 +13,16 @@ from .imports import (
 from .namespace import (
     NamespaceSerializer,
     NamespaceSummarySerializer,
-    NamespaceUpdateSerializer
+    NamespaceUpdateSerializer,
+    get_namespace_summaries,
 )
 
 from .current_user import (
     CurrentUserSerializer
 )
+from .token import (
+    TokenSerializer,
+)
 
 
 __all__ = (
@@ -36,6 +40,9 @@ __all__ = (
     'NamespaceSerializer',
     'NamespaceSummarySerializer',
     'NamespaceUpdateSerializer',
+    'get_namespace_summaries',
     # current_user
-    'CurrentUserSerializer'
+    'CurrentUserSerializer',
+    # token
+    'TokenSerializer',
 )
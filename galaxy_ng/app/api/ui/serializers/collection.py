@@ -102,8 +102,10 @@ class _CollectionSerializer(Serializer):
         raise NotImplementedError
 
     def get_namespace(self, obj):
-        namespace = self._get_namespace(obj)
-        return NamespaceSummarySerializer(namespace).data
+        summary = self._get_namespace(obj)
+        if summary is None:
+            return NamespaceSummarySerializer(None).data
+        return summary
 
 
 class CollectionListSerializer(_CollectionSerializer):
@@ -1,5 +1,7 @@
 import re
+import threading
 
+from django.conf import settings
 from django.db import transaction
 
 from rest_framework.exceptions import ValidationError
@@ -8,6 +10,11 @@ from rest_framework.serializers import ModelSerializer, SlugRelatedField
 from galaxy_ng.app import models
 from galaxy_ng.app.models import auth as auth_models
 from galaxy_ng.app.auth import auth
+from galaxy_ng.app.common import cache
+
+
+_summaries = None
+_summaries_lock = threading.Lock()
 
 
 class NamespaceLinkSerializer(ModelSerializer):
@@ -17,7 +24,7 @@ class NamespaceLinkSerializer(ModelSerializer):
 
 
 class NamespaceSerializer(ModelSerializer):
-    links = NamespaceLinkSerializer(many=True, required=False, read_only=True)
+    links = NamespaceLinkSerializer(many=True, required=False)
     groups = SlugRelatedField(
         many=True,
         slug_field='name',
@@ -72,11 +79,34 @@ class NamespaceSerializer(ModelSerializer):
             sanitized_groups.append(group.name)
         return sanitized_groups
 
+    @transaction.atomic
+    def create(self, validated_data):
+        links = validated_data.pop('links', None)
+
+        instance = super().create(validated_data)
+
+        if links:
+            instance.set_links(links)
+
+        return instance
+
     @transaction.atomic
     def update(self, instance, validated_data):
+        """Updates namespace writing only fields and relations that have changed."""
         links = validated_data.pop('links', None)
+        groups = validated_data.pop('groups', None)
 
-        instance = super().update(instance, validated_data)
+        changed_fields = [
+            name for name, value in validated_data.items() if getattr(instance, name) != value
+        ]
+        if changed_fields:
+            for name in changed_fields:
+                setattr(instance, name, validated_data[name])
+            instance.save(update_fields=changed_fields)
+
+        # NOTE: set() only adds and removes the difference
+        if groups is not None:
+            instance.groups.set(groups)
 
         if links is not None:
             instance.set_links(links)
@@ -121,3 +151,46 @@ class NamespaceSummarySerializer(NamespaceSerializer):
         )
 
         read_only_fields = ('name', )
+
+
+def get_namespace_summaries(names):
+    """
+    Returns a dict of serialized namespace summaries by namespace name.
+
+    Summaries are kept in an in-process LRU cache tagged with namespaces
+    content version for GALAXY_NAMESPACE_CACHE_TTL seconds, so that changes
+    made in other processes are picked up within that time. Names of
+    namespaces that do not exist are omitted.
+    """
+    global _summaries
+
+    timeout = settings.GALAXY_NAMESPACE_CACHE_TTL
+    if not timeout:
+        return {
+            namespace.name: dict(NamespaceSummarySerializer(namespace).data)
+            for namespace in models.Namespace.objects.filter(name__in=names)
+        }
+
+    if _summaries is None:
+        with _summaries_lock:
+            if _summaries is None:
+                _summaries = cache.LRUCache(settings.GALAXY_CACHE_MAX_ENTRIES)
+
+    version = cache.get_version(cache.NAMESPACES_SCOPE)
+
+    summaries = {}
+    missing = []
+    for name in names:
+        summary = _summaries.get((version, name))
+        if summary is None:
+            missing.append(name)
+        else:
+            summaries[name] = summary
+
+    if missing:
+        for namespace in models.Namespace.objects.filter(name__in=missing):
+            summary = dict(NamespaceSummarySerializer(namespace).data)
+            _summaries.set((version, namespace.name), summary, timeout)
+            summaries[namespace.name] = summary
+
+    return summaries
@@ -0,0 +1,19 @@
+from rest_framework.serializers import ModelSerializer
+
+from galaxy_ng.app import models
+
+
+class TokenSerializer(ModelSerializer):
+    class Meta:
+        model = models.Token
+        fields = (
+            'id',
+            'name',
+            'prefix',
+            'created_at',
+        )
+        read_only_fields = (
+            'id',
+            'prefix',
+            'created_at',
+        )
@@ -16,6 +16,7 @@ router.register(
     basename='collection-imports',
 )
 router.register('tags', viewsets.TagsViewSet, basename='tags')
+router.register('tokens', viewsets.TokenViewSet, basename='tokens')
 
 app_name = "ui"
 urlpatterns = [
@@ -2,6 +2,7 @@ from .namespace import NamespaceViewSet, MyNamespaceViewSet
 from .collection import CollectionViewSet, CollectionVersionViewSet, CollectionImportViewSet
 from .tags import TagsViewSet
 from .current_user import CurrentUserViewSet
+from .token import TokenViewSet
 
 __all__ = (
     'NamespaceViewSet',
@@ -10,5 +11,6 @@ __all__ = (
     'CollectionVersionViewSet',
     'CollectionImportViewSet',
     'TagsViewSet',
-    'CurrentUserViewSet'
+    'CurrentUserViewSet',
+    'TokenViewSet',
 )
@@ -1,60 +1,151 @@
+import json
+import re
+
 import galaxy_pulp
 from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F
 from django_filters import filters
 from django_filters.rest_framework import filterset, DjangoFilterBackend, OrderingFilter
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.decorators import action as drf_action
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 
 from galaxy_ng.app import models
+from galaxy_ng.app import tasks
 from galaxy_ng.app.api import base as api_base
 from galaxy_ng.app.api import permissions
+from galaxy_ng.app.api import renderers
 from galaxy_ng.app.api.ui import serializers
+from galaxy_ng.app.common import cache
 from galaxy_ng.app.common import pulp
 from galaxy_ng.app import constants
 
 
+_DOCS_BLOB_KEY = re.compile(rb'"docs_blob"\s*:\s*')
+# Strings and brackets of a JSON document, enough to find where a value ends
+_JSON_TOKENS = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+
+
+def _find_docs_blob(body):
+    """
+    Returns start and end offsets of the docs_blob object in JSON body.
+
+    Returns None if there is no docs_blob key or its value is not an
+    object or array.
+    """
+    match = _DOCS_BLOB_KEY.search(body)
+    if match is None or body[match.end():match.end() + 1] not in (b'{', b'['):
+        return None
+
+    depth = 0
+    for token in _JSON_TOKENS.finditer(body, match.end()):
+        char = token.group()[:1]
+        if char in b'{[':
+            depth += 1
+        elif char in b'}]':
+            depth -= 1
+            if depth == 0:
+                return match.end(), token.end()
+    return None
+
+
+def _list_versions_with_docs_blob(api, **params):
+    """
+    Returns collection versions matching params, including docs_blob.
+
+    Versions are fetched by a single pulp request. The docs_blob of the
+    first version is cut out of the response body as RawJSON and the rest
+    of the body is decoded, so the blob is passed to the client without
+    being decoded and encoded again.
+    """
+    response = api.list(limit=1, _preload_content=False, **params)
+    body = response.data
+
+    span = _find_docs_blob(body)
+    if span is None:
+        return json.loads(body)['results']
+
+    start, end = span
+    results = json.loads(body[:start] + b'null' + body[end:])['results']
+    results[0]['docs_blob'] = renderers.RawJSON(body[start:end])
+    return results
+
+
+class CollectionIndexFilter(filterset.FilterSet):
+    keywords = filters.CharFilter(method='keywords_filter')
+    tags = filters.CharFilter(method='tags_filter')
+    deprecated = filters.BooleanFilter(field_name='deprecated')
+
+    sort = OrderingFilter(
+        fields=(
+            ('namespace', 'namespace'),
+            ('name', 'name'),
+            ('pulp_created', 'created'),
+        ),
+    )
+
+    class Meta:
+        model = models.CollectionIndex
+        fields = ['namespace', 'name', 'certification']
+
+    def filter_queryset(self, queryset):
+        return super().filter_queryset(queryset.order_by('namespace', 'name'))
+
+    def keywords_filter(self, queryset, name, value):
+        """Matches collections with words starting with all keyword words by relevance."""
+        words = re.findall(r'[^\W_]+', value)
+        if not words:
+            return queryset
+
+        query = SearchQuery(
+            ' & '.join(f"'{word}':*" for word in words),
+            config='simple', search_type='raw',
+        )
+        return queryset.filter(search_vector=query).annotate(
+            rank=SearchRank(F('search_vector'), query)
+        ).order_by('-rank', 'namespace', 'name')
+
+    def tags_filter(self, queryset, name, value):
+        """Matches collections with all comma separated tags."""
+        tags = [
+            tag for value in self.data.getlist('tags') for tag in value.split(',') if tag
+        ]
+        return queryset.filter(tags__contains=tags)
+
+
 class CollectionViewSet(api_base.ViewSet):
     lookup_url_kwarg = 'collection'
     lookup_value_regex = r'[0-9a-z_]+/[0-9a-z_]+'
 
+    # Query parameters supported by the local collection index
+    LOCAL_LIST_PARAMS = frozenset(CollectionIndexFilter.base_filters) | {'offset', 'limit'}
+
     def list(self, request, *args, **kwargs):
         self.paginator.init_from_request(request)
 
-        params = {
-            'offset': self.paginator.offset,
-            'limit': self.paginator.limit,
-        }
-        for key, value in self.request.query_params.lists():
-            if key == 'keywords':
-                key = 'q'
-            if isinstance(value, list):
-                params[key] = ','.join(value)
-            else:
-                params[key] = value
-
-        api = galaxy_pulp.PulpCollectionsApi(pulp.get_client())
-
-        response = api.list(
-            is_highest=True,
-            exclude_fields='docs_blob',
-            **params
-        )
+        if (settings.GALAXY_COLLECTION_INDEX
+                and set(request.query_params) <= self.LOCAL_LIST_PARAMS):
+            results, count = self._list_local_collections(request)
+        else:
+            results, count = self._list_pulp_collections(request)
 
-        namespaces = set(collection['namespace'] for collection in response.results)
-        namespaces = self._query_namespaces(namespaces)
+        namespaces = set(collection['namespace'] for collection in results)
+        namespaces = serializers.get_namespace_summaries(namespaces)
 
         data = serializers.CollectionListSerializer(
-            response.results, many=True,
+            results, many=True,
             context={'namespaces': namespaces}
         ).data
-        return self.paginator.paginate_proxy_response(data, response.count)
+        return self.paginator.paginate_proxy_response(data, count)
 
     def retrieve(self, request, *args, **kwargs):
         namespace, name = self.kwargs['collection'].split('/')
-        namespace_obj = get_object_or_404(models.Namespace, name=namespace)
+        namespace_summary = serializers.get_namespace_summaries([namespace]).get(namespace)
+        if namespace_summary is None:
+            raise NotFound()
 
         params_dict = self.request.query_params.dict()
 
@@ -73,35 +164,68 @@ class CollectionViewSet(api_base.ViewSet):
         else:
             params['version'] = version
 
-        response = api.list(**params)
+        results, all_versions = pulp.fan_out(lambda func: func(), [
+            lambda: _list_versions_with_docs_blob(api, **params),
+            lambda: self._get_all_versions(api, namespace, name),
+        ])
+        for result in (results, all_versions):
+            if isinstance(result, Exception):
+                raise result
 
-        if not response.results:
+        if not results:
             raise NotFound()
 
-        all_versions = api.list(
-            namespace=namespace,
-            name=name,
-            fields='version,id,pulp_created,artifact',
-            certification=constants.CertificationStatus.CERTIFIED.value
-        )
-
-        all_versions = [
-            {
-                'version': collection['version'],
-                'id': collection['id'],
-                'created': collection['pulp_created']
-            } for collection in all_versions.results
-        ]
-
-        collection = response.results[0]
+        collection = results[0]
 
         data = serializers.CollectionDetailSerializer(
             collection,
-            context={'namespace': namespace_obj, 'all_versions': all_versions}
+            context={'namespace': namespace_summary, 'all_versions': all_versions}
         ).data
 
         return Response(data)
 
+    def _list_local_collections(self, request):
+        """Searches collections in the local collection index."""
+        filterset = CollectionIndexFilter(
+            request.query_params,
+            queryset=models.CollectionIndex.objects.only('data'),
+            request=request,
+        )
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        queryset = filterset.qs
+        offset, limit = self.paginator.offset, self.paginator.limit
+        results = [row.data for row in queryset[offset:offset + limit]]
+        return results, queryset.count()
+
+    def _list_pulp_collections(self, request):
+        params = {
+            'offset': self.paginator.offset,
+            'limit': self.paginator.limit,
+        }
+        for key, value in request.query_params.lists():
+            if key == 'keywords':
+                key = 'q'
+            if isinstance(value, list):
+                params[key] = ','.join(value)
+            else:
+                params[key] = value
+
+        def _list_collections():
+            api = galaxy_pulp.PulpCollectionsApi(pulp.get_client())
+            response = api.list(
+                is_highest=True,
+                exclude_fields='docs_blob',
+                **params
+            )
+            return response.results, response.count
+
+        return cache.get_or_set(
+            cache.COLLECTIONS_SCOPE, 'ui-collection-list', params,
+            _list_collections, settings.GALAXY_COLLECTION_CACHE_TTL,
+        )
+
     @property
     def paginator(self):
         """
@@ -115,10 +239,28 @@ class CollectionViewSet(api_base.ViewSet):
         return self._paginator
 
     @staticmethod
-    def _query_namespaces(names):
-        queryset = models.Namespace.objects.filter(name__in=names)
-        namespaces = {ns.name: ns for ns in queryset}
-        return namespaces
+    def _get_all_versions(api, namespace, name):
+        """Returns cached summary of all certified versions of a collection."""
+        def _list_versions():
+            response = api.list(
+                namespace=namespace,
+                name=name,
+                fields='version,id,pulp_created,artifact',
+                certification=constants.CertificationStatus.CERTIFIED.value
+            )
+            return [
+                {
+                    'version': collection['version'],
+                    'id': collection['id'],
+                    'created': collection['pulp_created']
+                } for collection in response.results
+            ]
+
+        return cache.get_or_set(
+            cache.COLLECTIONS_SCOPE, 'ui-collection-versions',
+            {'namespace': namespace, 'name': name},
+            _list_versions, settings.GALAXY_COLLECTION_CACHE_TTL,
+        )
 
 
 class CollectionVersionViewSet(api_base.GenericViewSet):
@@ -152,12 +294,15 @@ class CollectionVersionViewSet(api_base.GenericViewSet):
         namespace, name, version = self.kwargs['version'].split('/')
 
         api = galaxy_pulp.PulpCollectionsApi(pulp.get_client())
-        response = api.list(namespace=namespace, name=name, version=version, limit=1)
+        params = {'namespace': namespace, 'name': name, 'version': version}
 
-        if not response.results:
+        results = _list_versions_with_docs_blob(api, **params)
+        if not results:
             raise NotFound()
 
-        data = serializers.CollectionVersionDetailSerializer(response.results[0]).data
+        collection_version = results[0]
+
+        data = serializers.CollectionVersionDetailSerializer(collection_version).data
         return Response(data)
 
     @drf_action(
@@ -188,50 +333,58 @@ class CollectionVersionViewSet(api_base.GenericViewSet):
             version=version,
             certification_info=galaxy_pulp.CertificationInfo(certification),
         )
+        cache.invalidate_collections([(namespace, name)])
+        tasks.refresh_collection_index([(namespace, name)])
         return Response(response)
 
 
 class CollectionImportFilter(filterset.FilterSet):
     namespace = filters.CharFilter(field_name='namespace__name')
     created = filters.DateFilter(field_name='created_at')
+    started = filters.DateFilter(field_name='started_at')
+    finished = filters.DateFilter(field_name='finished_at')
 
     sort = OrderingFilter(
-        fields=(('created_at', 'created'),)
+        fields=(
+            ('created_at', 'created'),
+            ('started_at', 'started'),
+            ('finished_at', 'finished'),
+            ('state', 'state'),
+        )
     )
 
     class Meta:
         model = models.CollectionImport
-        fields = ['namespace', 'name', 'version']
+        fields = ['namespace', 'name', 'version', 'state']
 
 
 class CollectionImportViewSet(api_base.GenericViewSet):
     lookup_field = 'task_id'
-    queryset = models.CollectionImport.objects.all()
+    queryset = models.CollectionImport.objects.select_related('namespace')
     serializer_class = serializers.ImportTaskListSerializer
 
     filter_backends = [DjangoFilterBackend]
     filterset_class = CollectionImportFilter
 
     ordering_fields = ('created',)
+    cursor_ordering = '-created_at'
 
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
         page = self.paginate_queryset(queryset)
 
-        api = galaxy_pulp.GalaxyImportsApi(pulp.get_client())
+        tasks.refresh_collection_imports(page)
 
-        results = []
-        for task in page:
-            task_info = api.get(prefix=settings.X_PULP_API_PREFIX, id=str(task.pk))
-            data = serializers.ImportTaskListSerializer(task_info, context={'task_obj': task}).data
-            results.append(data)
+        results = [
+            serializers.ImportTaskListSerializer(task, context={'task_obj': task}).data
+            for task in page
+        ]
         return self.get_paginated_response(results)
 
     @swagger_auto_schema(operation_summary="Retrieve collection import",
                          responses={200: serializers.ImportTaskDetailSerializer})
     def retrieve(self, request, *args, **kwargs):
-        api = galaxy_pulp.GalaxyImportsApi(pulp.get_client())
         task = self.get_object()
-        task_info = api.get(prefix=settings.X_PULP_API_PREFIX, id=self.kwargs['task_id'])
-        data = serializers.ImportTaskDetailSerializer(task_info, context={'task_obj': task}).data
+        tasks.refresh_collection_imports([task])
+        data = serializers.ImportTaskDetailSerializer(task, context={'task_obj': task}).data
         return Response(data)
@@ -10,7 +10,7 @@ class CurrentUserViewSet(api_base.GenericViewSet):
 
     def retrieve(self, request, *args, **kwargs):
         data = serializers.CurrentUserSerializer({
-            'is_partner_engineer': permissions.IsPartnerEngineer().has_permission(request, self)
+            'is_partner_engineer': permissions.is_partner_engineer(request)
         }).data
 
         return Response(data)
@@ -1,3 +1,7 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db.models import F, Prefetch, Q
 from django_filters import filters
 from django_filters.rest_framework import filterset, DjangoFilterBackend
 
@@ -32,13 +36,34 @@ class NamespaceFilter(filterset.FilterSet):
         fields = ('name', 'company',)
 
     def keywords_filter(self, queryset, name, value):
+        """
+        Searches namespaces by keywords.
+
+        Matches namespaces with name, company or description words starting
+        with all keyword words, or with name containing any of keywords.
+        Results are ordered by relevance.
+        """
+        keywords = [
+            keyword for keyword in self.request.query_params.getlist('keywords') if keyword
+        ]
+        if not keywords:
+            return queryset
+        words = [word for keyword in keywords for word in re.findall(r'[^\W_]+', keyword)]
 
-        keywords = self.request.query_params.getlist('keywords')
-
+        condition = Q()
         for keyword in keywords:
-            queryset = queryset.filter(name=keyword)
+            condition |= Q(name__icontains=keyword)
 
-        return queryset
+        rank = TrigramSimilarity('name', ' '.join(keywords))
+        if words:
+            query = SearchQuery(
+                ' & '.join(f"'{word}':*" for word in words),
+                config='simple', search_type='raw',
+            )
+            condition |= Q(search_vector=query)
+            rank = rank + SearchRank(F('search_vector'), query)
+
+        return queryset.filter(condition).annotate(rank=rank).order_by('-rank', 'name')
 
 
 class NamespaceViewSet(
@@ -55,6 +80,8 @@ class NamespaceViewSet(
     filter_backends = (DjangoFilterBackend,)
     filterset_class = NamespaceFilter
 
+    cursor_ordering = 'name'
+
     def create(self, request, *args, **kwargs):
         groups = []
         for account in request.data['groups']:
@@ -91,6 +118,9 @@ class NamespaceViewSet(
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
 
+        # Links and groups may have changed, invalidate prefetched ones
+        instance._prefetched_objects_cache = {}
+
         return Response(serializer.data)
 
     def perform_update(self, serializer):
@@ -105,18 +135,34 @@ class NamespaceViewSet(
             return serializers.NamespaceSerializer
 
     def get_queryset(self):
-        return models.Namespace.objects.all()
+        queryset = models.Namespace.objects.all()
+
+        # Summaries have no related objects, load only the rendered columns
+        if self.action == 'list':
+            return queryset.only(*serializers.NamespaceSummarySerializer.Meta.fields)
+
+        return queryset.defer('search_vector').prefetch_related(
+            Prefetch(
+                'links',
+                queryset=models.NamespaceLink.objects.only('name', 'url', 'namespace'),
+            ),
+            Prefetch(
+                'groups',
+                queryset=auth_models.Group.objects.only('name'),
+            ),
+        )
 
 
 class MyNamespaceViewSet(NamespaceViewSet):
     def get_queryset(self):
-        # All namespaces for users in the partner-engineers groups
+        queryset = super().get_queryset()
 
-        if permissions.IsPartnerEngineer().has_permission(self.request, self):
-            queryset = models.Namespace.objects.all()
+        # All namespaces for users in the partner-engineers groups
+        if permissions.is_partner_engineer(self.request):
             return queryset
 
-        # Just the namespaces with groups the user is in
-        queryset = models.Namespace.objects.filter(
-            groups__in=self.request.user.groups.all())
-        return queryset
+        # Just the namespaces with groups the user is in. A namespace
+        # may share more than one group with the user.
+        return queryset.filter(
+            groups__name__in=permissions.get_group_names(self.request)
+        ).distinct()
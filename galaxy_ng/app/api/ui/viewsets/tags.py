@@ -2,13 +2,17 @@ import galaxy_pulp
 
 from pulp_ansible.app.serializers import TagSerializer
 
+from galaxy_ng.app.common import cache
 from galaxy_ng.app.common import pulp
 from galaxy_ng.app.api import base as api_base
+from galaxy_ng.app.api import caching
 
 
 class TagsViewSet(api_base.GenericViewSet):
     serializer_class = TagSerializer
 
+    @caching.cache_headers('ui-tags', ())
+    @caching.conditional_get(cache.COLLECTIONS_SCOPE)
     def list(self, request, *args, **kwargs):
         self.paginator.init_from_request(request)
 
@@ -0,0 +1,35 @@
+from rest_framework import mixins
+from rest_framework import status
+from rest_framework.response import Response
+
+from galaxy_ng.app import models
+from galaxy_ng.app.api import base as api_base
+from galaxy_ng.app.api.ui import serializers
+
+
+class TokenViewSet(
+    mixins.ListModelMixin,
+    mixins.DestroyModelMixin,
+    api_base.GenericViewSet,
+):
+    """
+    Manages API tokens of the current user.
+
+    Token key is returned only in the response to token creation.
+    """
+
+    serializer_class = serializers.TokenSerializer
+
+    def get_queryset(self):
+        return models.Token.objects.filter(user=self.request.user)
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        token, key = models.Token.objects.create_token(
+            request.user, name=serializer.validated_data.get('name', ''))
+
+        data = self.get_serializer(token).data
+        data['token'] = key
+        return Response(data, status=status.HTTP_201_CREATED)
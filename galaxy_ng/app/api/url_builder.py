@@ -0,0 +1,83 @@
+import functools
+from urllib.parse import quote
+
+from django.urls import get_script_prefix, reverse
+from django.utils.http import RFC3986_SUBDELIMS
+
+
+__all__ = (
+    'build_url',
+    'collection_href',
+    'collection_versions_href',
+    'collection_version_href',
+    'collection_import_href',
+)
+
+# Safe characters of path segment, see django.urls.resolvers.URLResolver
+_SAFE_PATH_CHARS = RFC3986_SUBDELIMS + '/~:@'
+_SAFE_SEGMENT_CHARS = RFC3986_SUBDELIMS + '~:@'
+
+_PLACEHOLDER = '__galaxy_url_{}__'
+
+
+@functools.lru_cache(maxsize=None)
+def _get_template(viewname, arg_names):
+    """
+    Compiles a named route into a format string.
+
+    The route is reversed once with placeholder arguments which are then
+    replaced with format fields. Script prefix is stripped from the
+    template and prepended when URL is built, as it may differ between
+    requests.
+    """
+    placeholders = {name: _PLACEHOLDER.format(name) for name in arg_names}
+    path = reverse(viewname, kwargs=placeholders)
+
+    prefix = quote(get_script_prefix(), safe=_SAFE_PATH_CHARS)
+    path = path[len(prefix):]
+
+    template = path.replace('{', '{{').replace('}', '}}')
+    for name, placeholder in placeholders.items():
+        template = template.replace(placeholder, '{%s}' % name)
+    return template
+
+
+@functools.lru_cache(maxsize=8)
+def _quote_prefix(prefix):
+    return quote(prefix, safe=_SAFE_PATH_CHARS)
+
+
+def build_url(viewname, **kwargs):
+    """
+    Builds URL path of a named route.
+
+    Equivalent to ``django.urls.reverse(viewname, kwargs=kwargs)`` for
+    routes with string path arguments, except that argument values are
+    not validated against route patterns. The route is resolved only on
+    first use.
+    """
+    template = _get_template(viewname, tuple(sorted(kwargs)))
+    values = {
+        name: quote(str(value), safe=_SAFE_SEGMENT_CHARS)
+        for name, value in kwargs.items()
+    }
+    return _quote_prefix(get_script_prefix()) + template.format_map(values)
+
+
+def collection_href(namespace, name):
+    return build_url('galaxy:api:v3:collection', namespace=namespace, name=name)
+
+
+def collection_versions_href(namespace, name):
+    return build_url('galaxy:api:v3:collection-version-list', namespace=namespace, name=name)
+
+
+def collection_version_href(namespace, name, version):
+    return build_url(
+        'galaxy:api:v3:collection-version',
+        namespace=namespace, name=name, version=version
+    )
+
+
+def collection_import_href(task_id):
+    return build_url('galaxy:api:v3:collection-import', pk=task_id)
@@ -4,9 +4,14 @@ from urllib import parse as urlparse
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.http import StreamingHttpResponse, HttpResponseRedirect
-from django.urls import reverse
-
+from django.http import (
+    HttpResponse,
+    HttpResponseNotModified,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
+
+from rest_framework import status
 from rest_framework.exceptions import APIException, NotFound
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
@@ -15,24 +20,39 @@ import galaxy_pulp
 import requests
 
 from galaxy_ng.app.api import base as api_base
+from galaxy_ng.app.api import caching
+from galaxy_ng.app.api import url_builder
 from galaxy_ng.app.api.ui import serializers
 from galaxy_ng.app.api.v3.serializers import CollectionSerializer, CollectionUploadSerializer
+from galaxy_ng.app.common import cache
 from galaxy_ng.app.common import pulp
 from galaxy_ng.app.common import metrics
 from galaxy_ng.app.api import permissions
 from galaxy_ng.app import models
 from galaxy_ng.app import constants
+from galaxy_ng.app import tasks
 
 
 log = logging.getLogger(__name__)
 
 
+def _load_json(response):
+    """
+    Decodes raw pulp response requested with ``_preload_content=False``.
+
+    Bypasses deserialization of the response into pulp client models.
+    """
+    return json.loads(response.data)
+
+
 class CollectionViewSet(api_base.GenericViewSet):
     permission_classes = api_base.GALAXY_PERMISSION_CLASSES + [
         permissions.IsNamespaceOwnerOrPartnerEngineer,
     ]
     serializer_class = CollectionSerializer
 
+    @caching.cache_headers('v3-collection-list', ())
+    @caching.conditional_get(cache.COLLECTIONS_SCOPE)
     def list(self, request, *args, **kwargs):
         self.paginator.init_from_request(request)
 
@@ -42,19 +62,29 @@ class CollectionViewSet(api_base.GenericViewSet):
             'limit': self.paginator.limit,
         })
 
-        api = galaxy_pulp.GalaxyCollectionsApi(pulp.get_client())
-        response = api.list(prefix=settings.X_PULP_API_PREFIX, **params)
-        data = list(map(self._fix_item_urls, response.results))
-        return self.paginator.paginate_proxy_response(data, response.count)
+        def _list_collections():
+            api = galaxy_pulp.GalaxyCollectionsApi(pulp.get_client())
+            response = _load_json(api.list(
+                prefix=settings.X_PULP_API_PREFIX, _preload_content=False, **params))
+            return list(map(self._fix_item_urls, response['results'])), response['count']
+
+        data, count = cache.get_or_set(
+            cache.COLLECTIONS_SCOPE, 'v3-collection-list', params,
+            _list_collections, settings.GALAXY_COLLECTION_CACHE_TTL,
+        )
+        return self.paginator.paginate_proxy_response(data, count)
 
+    @caching.cache_headers('v3-collection', ('namespace', 'name'))
+    @caching.conditional_get(cache.COLLECTIONS_SCOPE)
     def retrieve(self, request, *args, **kwargs):
         api = galaxy_pulp.GalaxyCollectionsApi(pulp.get_client())
 
-        response = api.get(
+        response = _load_json(api.get(
             prefix=settings.X_PULP_API_PREFIX,
             namespace=self.kwargs['namespace'],
-            name=self.kwargs['name']
-        )
+            name=self.kwargs['name'],
+            _preload_content=False,
+        ))
         response = self._fix_item_urls(response)
 
         return Response(response)
@@ -74,14 +104,17 @@ class CollectionViewSet(api_base.GenericViewSet):
 
         api = galaxy_pulp.GalaxyCollectionsApi(pulp.get_client())
 
-        response = api.put(
+        response = _load_json(api.put(
             prefix=settings.X_PULP_API_PREFIX,
             namespace=namespace,
             name=name,
             collection=collection,
-        )
+            _preload_content=False,
+        ))
+        cache.invalidate_collections([(namespace, name)])
+        tasks.refresh_collection_index([(namespace, name)])
 
-        return Response(response.to_dict())
+        return Response(response)
 
     @staticmethod
     def _fix_item_urls(data):
@@ -89,24 +122,18 @@ class CollectionViewSet(api_base.GenericViewSet):
         name = data['name']
         highest_version = data['highest_version']['version']
 
-        data['href'] = reverse(
-            'galaxy:api:v3:collection',
-            kwargs=dict(namespace=namespace, name=name)
-        )
-        data['versions_url'] = reverse(
-            'galaxy:api:v3:collection-version-list',
-            kwargs=dict(namespace=namespace, name=name)
-        )
-        data['highest_version']['href'] = reverse(
-            'galaxy:api:v3:collection-version',
-            kwargs=dict(namespace=namespace, name=name, version=highest_version)
-        )
+        data['href'] = url_builder.collection_href(namespace, name)
+        data['versions_url'] = url_builder.collection_versions_href(namespace, name)
+        data['highest_version']['href'] = url_builder.collection_version_href(
+            namespace, name, highest_version)
         return data
 
 
 class CollectionVersionViewSet(api_base.GenericViewSet):
     serializer_class = serializers.CollectionVersionSerializer
 
+    @caching.cache_headers('v3-collection-version-list', ('namespace', 'name'))
+    @caching.conditional_get(cache.COLLECTIONS_SCOPE)
     def list(self, request, *args, **kwargs):
         self.paginator.init_from_request(request)
 
@@ -118,28 +145,32 @@ class CollectionVersionViewSet(api_base.GenericViewSet):
         })
 
         api = galaxy_pulp.GalaxyCollectionVersionsApi(pulp.get_client())
-        response = api.list(
+        response = _load_json(api.list(
             prefix=settings.X_PULP_API_PREFIX,
             namespace=self.kwargs['namespace'],
             name=self.kwargs['name'],
+            _preload_content=False,
             **params,
-        )
+        ))
 
         # Consider an empty list of versions as a 404 on the Collection
-        if not response.results:
+        if not response['results']:
             raise NotFound()
 
-        self._fix_list_urls(response.results)
-        return self.paginator.paginate_proxy_response(response.results, response.count)
+        self._fix_list_urls(response['results'])
+        return self.paginator.paginate_proxy_response(response['results'], response['count'])
 
+    @caching.cache_headers('v3-collection-version', ('namespace', 'name', 'version'))
+    @caching.conditional_get(cache.COLLECTIONS_SCOPE)
     def retrieve(self, request, *args, **kwargs):
         api = galaxy_pulp.GalaxyCollectionVersionsApi(pulp.get_client())
-        response = api.get(
+        response = _load_json(api.get(
             prefix=settings.X_PULP_API_PREFIX,
             namespace=self.kwargs['namespace'],
             name=self.kwargs['name'],
             version=self.kwargs['version'],
-        )
+            _preload_content=False,
+        ))
         self._fix_retrieve_url(response)
         response['download_url'] = self._transform_pulp_url(request, response['download_url'])
         return Response(response)
@@ -158,32 +189,32 @@ class CollectionVersionViewSet(api_base.GenericViewSet):
 
         for item in data:
             version = item['version']
-            item['href'] = reverse(
-                'galaxy:api:v3:collection-version',
-                kwargs=dict(namespace=namespace, name=name, version=version)
-            )
+            item['href'] = url_builder.collection_version_href(namespace, name, version)
 
     def _fix_retrieve_url(self, data):
         namespace = self.kwargs['namespace']
         name = self.kwargs['name']
         version = self.kwargs['version']
 
-        data['href'] = reverse(
-            'galaxy:api:v3:collection-version',
-            kwargs=dict(namespace=namespace, name=name, version=version)
-        )
-        data['collection'] = reverse(
-            'galaxy:api:v3:collection',
-            kwargs=dict(namespace=namespace, name=name)
-        )
+        data['href'] = url_builder.collection_version_href(namespace, name, version)
+        data['collection'] = url_builder.collection_href(namespace, name)
 
 
 class CollectionImportViewSet(api_base.ViewSet):
 
     def retrieve(self, request, pk):
-        api = galaxy_pulp.GalaxyImportsApi(pulp.get_client())
-        response = api.get(prefix=settings.X_PULP_API_PREFIX, id=pk)
-        return Response(response.to_dict())
+        task = get_object_or_404(models.CollectionImport, pk=pk)
+        tasks.refresh_collection_imports([task])
+        return Response({
+            'id': task.id,
+            'state': task.state,
+            'created_at': task.created_at,
+            'updated_at': task.updated_at,
+            'started_at': task.started_at,
+            'finished_at': task.finished_at,
+            'error': task.error,
+            'messages': task.messages,
+        })
 
 
 class CollectionArtifactUploadView(api_base.APIView):
@@ -208,33 +239,29 @@ class CollectionArtifactUploadView(api_base.APIView):
             )
 
         self.check_object_permissions(request, namespace)
-        api = pulp.get_client()
-        url = '{host}/{prefix}/{path}'.format(
-            host=api.configuration.host,
-            path='v3/artifacts/collections/',
-            prefix=settings.X_PULP_API_PREFIX
-        )
-        headers = {}
-        headers.update(api.default_headers)
-        headers.update({'Content-Type': 'multipart/form-data'})
 
-        api.update_params_for_auth(headers, tuple(), api.configuration.auth_settings())
+        if settings.GALAXY_UPLOAD_ASYNC:
+            import_obj = tasks.stage_collection_artifact(
+                data['file'], filename, namespace, data['mimetype'], sha256=data['sha256'])
+            log.info('Staging of artifact %s to namespace=%s by user=%s created import task_id=%s', # noqa
+                     data['file'].name, namespace, request.user, import_obj.task_id)
 
-        post_params = self._prepare_post_params(data)
-        try:
-            upload_response = api.request(
-                'POST',
-                url,
-                headers=headers,
-                post_params=post_params,
+            return Response(
+                data={'task': url_builder.collection_import_href(import_obj.task_id)},
+                status=status.HTTP_202_ACCEPTED,
             )
+
+        try:
+            upload_response = pulp.post_collection_artifact(
+                data['file'], filename, data['mimetype'], sha256=data['sha256'])
         except galaxy_pulp.ApiException:
-            log.exception('Failed to publish artifact %s (namespace=%s, sha256=%s) to pulp at url=%s',  # noqa
-                          data['file'].name, namespace, data.get('sha256'), url)
+            log.exception('Failed to publish artifact %s (namespace=%s, sha256=%s) to pulp',
+                          data['file'].name, namespace, data.get('sha256'))
             raise
 
         upload_response_data = json.loads(upload_response.data)
 
+        api = pulp.get_client()
         task_detail = api.call_api(
             upload_response_data['task'],
             'GET',
@@ -246,62 +273,133 @@ class CollectionArtifactUploadView(api_base.APIView):
         log.info('Publishing of artifact %s to namespace=%s by user=%s created pulp import task_id=%s', # noqa
                  data['file'].name, namespace, request.user, task_detail.id)
 
-        import_obj = models.CollectionImport.objects.create(
+        import_obj = models.CollectionImport(
             task_id=task_detail.id,
+            pulp_task_id=task_detail.id,
             created_at=task_detail.created_at,
             namespace=namespace,
             name=data['filename'].name,
             version=data['filename'].version,
         )
+        import_obj.update_from_task(task_detail)
+        import_obj.save(force_insert=True)
 
+        cache.invalidate_collections([(filename.namespace, filename.name)])
         metrics.collection_import_successes.inc()
         return Response(
-            data={'task': import_obj.get_absolute_url()},
+            data={'task': url_builder.collection_import_href(import_obj.task_id)},
             status=upload_response.status
         )
 
-    @staticmethod
-    def _prepare_post_params(data):
-        filename = data['filename']
-        post_params = [
-            ('file', (data['file'].name, data['file'].read(), data['mimetype'])),
-            ('expected_namespace', filename.namespace),
-            ('expected_name', filename.name),
-            ('expected_version', filename.version),
-        ]
-        if data['sha256']:
-            post_params.append(('sha256', data['sha256']))
-        return post_params
-
 
 class CollectionArtifactDownloadView(api_base.APIView):
+    PASSTHROUGH_REQUEST_HEADERS = (
+        ('Range', 'HTTP_RANGE'),
+        ('If-Range', 'HTTP_IF_RANGE'),
+        ('If-None-Match', 'HTTP_IF_NONE_MATCH'),
+        ('If-Modified-Since', 'HTTP_IF_MODIFIED_SINCE'),
+    )
+    PASSTHROUGH_RESPONSE_HEADERS = (
+        'Accept-Ranges',
+        'Content-Encoding',
+        'Content-Length',
+        'Content-Range',
+        'ETag',
+        'Last-Modified',
+    )
+
     def get(self, request, *args, **kwargs):
         metrics.collection_artifact_download_attempts.inc()
 
-        # NOTE(cutwater): Using urllib3 because it's already a dependency of galaxy_ng
-        url = 'http://{host}:{port}/{prefix}/automation-hub/{filename}'.format(
+        path = '{prefix}/automation-hub/{filename}'.format(
+            prefix=settings.X_PULP_CONTENT_PATH_PREFIX.strip('/'),
+            filename=urlparse.quote(self.kwargs['filename']),
+        )
+
+        if settings.GALAXY_DOWNLOAD_OFFLOAD_HEADER:
+            return self._offload_download(path)
+
+        url = 'http://{host}:{port}/{path}'.format(
             host=settings.X_PULP_CONTENT_HOST,
             port=settings.X_PULP_CONTENT_PORT,
-            prefix=settings.X_PULP_CONTENT_PATH_PREFIX.strip('/'),
-            filename=self.kwargs['filename'],
+            path=path,
+        )
+        headers = {
+            header: request.META[meta_key]
+            for header, meta_key in self.PASSTHROUGH_REQUEST_HEADERS
+            if meta_key in request.META
+        }
+        response = pulp.get_content_session().get(
+            url,
+            headers=headers,
+            stream=True,
+            allow_redirects=False,
+            timeout=pulp.get_content_timeout(),
         )
-        response = requests.get(url, stream=True, allow_redirects=False)
 
         if response.status_code == requests.codes.not_found:
+            response.close()
             metrics.collection_artifact_download_failures.labels(status=requests.codes.not_found).inc() # noqa
             raise NotFound()
 
         if response.status_code == requests.codes.found:
+            response.close()
             return HttpResponseRedirect(response.headers['Location'])
 
-        if response.status_code == requests.codes.ok:
+        if response.status_code == requests.codes.not_modified:
+            response.close()
+            metrics.collection_artifact_download_successes.inc()
+            return self._copy_headers(response, HttpResponseNotModified())
+
+        if response.status_code == requests.codes.requested_range_not_satisfiable:
+            response.close()
+            return self._copy_headers(response, HttpResponse(status=response.status_code))
+
+        if response.status_code in (requests.codes.ok, requests.codes.partial_content):
             metrics.collection_artifact_download_successes.inc()
 
-            return StreamingHttpResponse(
-                response.iter_content(chunk_size=4096),
+            streaming_response = StreamingHttpResponse(
+                self._stream_content(response, pulp.get_content_chunk_size()),
+                status=response.status_code,
                 content_type=response.headers['Content-Type']
             )
+            return self._copy_headers(response, streaming_response)
 
+        response.close()
         metrics.collection_artifact_download_failures.labels(status=response.status_code).inc()
         raise APIException('Unexpected response from content app. '
                            f'Code: {response.status_code}.')
+
+    @classmethod
+    def _copy_headers(cls, source, response):
+        for header in cls.PASSTHROUGH_RESPONSE_HEADERS:
+            if header in source.headers:
+                response[header] = source.headers[header]
+        return response
+
+    @staticmethod
+    def _stream_content(response, chunk_size):
+        try:
+            # Content is passed as is to match passed through headers
+            yield from response.raw.stream(chunk_size, decode_content=False)
+        finally:
+            # Release connection back to the pool if client disconnects early
+            response.close()
+
+    @staticmethod
+    def _offload_download(path):
+        """
+        Delegates artifact transfer to the front proxy.
+
+        Responds with an internal redirect header (e.g. nginx X-Accel-Redirect)
+        pointing at GALAXY_DOWNLOAD_OFFLOAD_PREFIX location, which the front
+        proxy must route to the pulp content app.
+        """
+        response = HttpResponse()
+        del response['Content-Type']
+        response[settings.GALAXY_DOWNLOAD_OFFLOAD_HEADER] = '{prefix}/{path}'.format(
+            prefix=settings.GALAXY_DOWNLOAD_OFFLOAD_PREFIX.rstrip('/'),
+            path=path,
+        )
+        metrics.collection_artifact_download_successes.inc()
+        return response
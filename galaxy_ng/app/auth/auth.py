@@ -1,13 +1,15 @@
 import base64
+import hashlib
 import json
 
 from django.conf import settings
 from django.db import transaction
-from rest_framework.authentication import BaseAuthentication
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.permissions import BasePermission
 
-from galaxy_ng.app.models.auth import Group, User
+from galaxy_ng.app.common import cache
+from galaxy_ng.app.models.auth import Group, Token, User
 
 
 RH_ACCOUNT_SCOPE = 'rh-identity-account'
@@ -19,6 +21,10 @@ class RHIdentityAuthentication(BaseAuthentication):
 
     For users logging in first time creates User record and
     Tenant record for user's account if it doesn't exist.
+
+    Authenticated user is cached by identity header digest for
+    GALAXY_IDENTITY_CACHE_TTL seconds, so repeated requests skip header
+    decoding and user synchronization.
     """
 
     header = 'HTTP_X_RH_IDENTITY'
@@ -33,7 +39,18 @@ class RHIdentityAuthentication(BaseAuthentication):
         if self.header not in request.META:
             return None
 
-        header = self._decode_header(request.META[self.header])
+        raw_header = request.META[self.header]
+        cache_key = self._get_cache_key(raw_header)
+        backend = cache.get_cache()
+
+        cached = backend.get(cache_key) if settings.GALAXY_IDENTITY_CACHE_TTL else None
+        if cached is not None:
+            user_id, header = cached
+            user = User.objects.filter(pk=user_id).first()
+            if user is not None:
+                return user, {'rh_identity': header}
+
+        header = self._decode_header(raw_header)
 
         try:
             identity = header['identity']
@@ -48,29 +65,44 @@ class RHIdentityAuthentication(BaseAuthentication):
         first_name = user.get('first_name', '')
         last_name = user.get('last_name', '')
 
-        group, _ = Group.objects.get_or_create_identity(RH_ACCOUNT_SCOPE, account)
-
         user = self._ensure_user(
             username,
-            group,
+            account,
             email=email,
             first_name=first_name,
             last_name=last_name
         )
 
+        if settings.GALAXY_IDENTITY_CACHE_TTL:
+            backend.set(cache_key, (user.pk, header), settings.GALAXY_IDENTITY_CACHE_TTL)
+
         return user, {'rh_identity': header}
 
     @staticmethod
-    def _ensure_user(username, group, **attrs):
+    def _ensure_user(username, account, **attrs):
+        """Creates user or updates attributes that have changed."""
         with transaction.atomic():
-            user, created = User.objects.update_or_create(
+            user, created = User.objects.get_or_create(
                 username=username,
                 defaults=attrs,
             )
             if created:
+                group, _ = Group.objects.get_or_create_identity(RH_ACCOUNT_SCOPE, account)
                 user.groups.add(group)
+                return user
+
+        changed_fields = [name for name, value in attrs.items() if getattr(user, name) != value]
+        if changed_fields:
+            for name in changed_fields:
+                setattr(user, name, attrs[name])
+            user.save(update_fields=changed_fields)
         return user
 
+    @staticmethod
+    def _get_cache_key(raw):
+        digest = hashlib.sha256(raw.encode('utf-8')).hexdigest()
+        return f'galaxy:rh-identity:{digest}'
+
     @staticmethod
     def _decode_header(raw):
         try:
@@ -80,6 +112,47 @@ class RHIdentityAuthentication(BaseAuthentication):
             raise AuthenticationFailed
 
 
+class TokenAuthentication(BaseAuthentication):
+    """
+    Authenticates users by API token.
+
+    Clients pass the token key in ``Authorization: Token <key>`` header.
+    Tokens are looked up by key digest, so no key derivation is needed
+    and the token and its user are loaded by a single indexed query.
+    Tokens are not cached, so revocation takes effect immediately.
+    """
+
+    keyword = 'Token'
+
+    def authenticate(self, request):
+        """
+        Authenticates user.
+
+        Raises:
+            AuthenticationFailed: If invalid token provided.
+        """
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed('Invalid token header.')
+
+        try:
+            key = auth[1].decode('ascii')
+        except UnicodeError:
+            raise AuthenticationFailed('Invalid token header.')
+
+        digest = Token.objects.make_digest(key)
+        token = Token.objects.select_related('user').filter(digest=digest).first()
+        if token is None or not token.user.is_active:
+            raise AuthenticationFailed('Invalid token.')
+
+        return token.user, token.pk
+
+    def authenticate_header(self, request):
+        return self.keyword
+
+
 class RHEntitlementRequired(BasePermission):
     """
     Allows access if user has RedHat entitlement specified
@@ -0,0 +1,194 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+
+COLLECTIONS_SCOPE = 'collections'
+NAMESPACES_SCOPE = 'namespaces'
+
+COLLECTIONS_SURROGATE_KEY = 'collections'
+
+_KEY_PREFIX = 'galaxy'
+
+_lru_cache = None
+_lru_cache_lock = threading.Lock()
+
+log = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache with per-entry expiration.
+
+    Implements the subset of django cache API used by galaxy_ng.
+    Cached values are stored by reference and must not be mutated.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                return default
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        expires = time.monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+def get_cache():
+    """
+    Returns cache backend configured by GALAXY_CACHE_BACKEND setting.
+
+    Supported backends are "lru" for in-process LRU cache and "django"
+    for a django cache selected by GALAXY_CACHE_ALIAS setting.
+    Only a django cache shared between workers propagates invalidation
+    to all processes.
+    """
+    global _lru_cache
+
+    if settings.GALAXY_CACHE_BACKEND == 'django':
+        return caches[settings.GALAXY_CACHE_ALIAS]
+
+    if _lru_cache is None:
+        with _lru_cache_lock:
+            if _lru_cache is None:
+                _lru_cache = LRUCache(settings.GALAXY_CACHE_MAX_ENTRIES)
+    return _lru_cache
+
+
+def _now_ns():
+    # NOTE: time.time_ns() is not available before python 3.7
+    return int(time.time() * 10 ** 9)
+
+
+def get_version(scope):
+    """
+    Returns current content version of a scope.
+
+    Versions are nanosecond timestamps, so a version lost on cache
+    eviction or restart is re-initialized to a value never used before.
+    """
+    backend = get_cache()
+    key = f'{_KEY_PREFIX}:version:{scope}'
+    version = backend.get(key)
+    if version is None:
+        version = _now_ns()
+        backend.set(key, version, None)
+    return version
+
+
+def bump_version(scope):
+    """Invalidates all entries cached under a scope."""
+    backend = get_cache()
+    key = f'{_KEY_PREFIX}:version:{scope}'
+    version = backend.get(key) or 0
+    backend.set(key, max(_now_ns(), version + 1), None)
+
+
+def make_key(scope, name, params):
+    """Builds a versioned cache key from normalized parameters."""
+    params_json = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.sha1(params_json.encode('utf-8')).hexdigest()
+    return f'{_KEY_PREFIX}:{scope}:{get_version(scope)}:{name}:{digest}'
+
+
+def get_or_set(scope, name, params, func, timeout):
+    """
+    Returns cached result of ``func`` for given parameters.
+
+    Caching is disabled when ``timeout`` is zero.
+    """
+    if not timeout:
+        return func()
+
+    backend = get_cache()
+    key = make_key(scope, name, params)
+    value = backend.get(key)
+    if value is None:
+        value = func()
+        backend.set(key, value, timeout)
+    return value
+
+
+def get_surrogate_keys(namespace=None, name=None, version=None):
+    """
+    Returns surrogate keys of proxied collection content.
+
+    Without arguments returns the key shared by all collection listings.
+    """
+    if namespace is None:
+        return [COLLECTIONS_SURROGATE_KEY]
+
+    keys = [f'namespace/{namespace}']
+    if name is not None:
+        keys.append(f'collection/{namespace}/{name}')
+    if version is not None:
+        keys.append(f'collection-version/{namespace}/{name}/{version}')
+    return keys
+
+
+def purge_surrogate_keys(keys):
+    """
+    Purges surrogate keys from the caching proxy.
+
+    Calls a function configured by GALAXY_SURROGATE_PURGE_HOOK setting
+    with a list of keys. Hook failures are logged and otherwise ignored.
+    """
+    if not settings.GALAXY_SURROGATE_PURGE_HOOK:
+        return
+
+    try:
+        purge = import_string(settings.GALAXY_SURROGATE_PURGE_HOOK)
+        purge(keys)
+    except Exception:
+        log.exception('Failed to purge surrogate keys %s', keys)
+
+
+def invalidate_collections(collections=()):
+    """
+    Invalidates cached collection listings after content change.
+
+    Surrogate keys of all listings and of given collections, an iterable
+    of (namespace, name) tuples, are purged from the caching proxy.
+    """
+    bump_version(COLLECTIONS_SCOPE)
+
+    keys = get_surrogate_keys()
+    for namespace, name in collections:
+        keys.append(get_surrogate_keys(namespace, name)[-1])
+    purge_surrogate_keys(keys)
+
+
+def invalidate_namespaces():
+    """Invalidates cached namespace data after namespace change."""
+    bump_version(NAMESPACES_SCOPE)
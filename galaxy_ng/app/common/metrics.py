@@ -1,4 +1,4 @@
-from prometheus_client import Counter
+from prometheus_client import Counter, Gauge, Histogram
 
 
 collection_import_attempts = Counter(
@@ -31,3 +31,29 @@ collection_artifact_download_successes = Counter(
     "galaxy_api_collection_artifact_download_successes",
     "count of successful collection artifact downloads"
 )
+
+pulp_client_pool_connections_in_use = Gauge(
+    "galaxy_api_pulp_client_pool_connections_in_use",
+    "number of pulp API client connections currently checked out of the pool"
+)
+
+pulp_client_pool_idle_connections = Gauge(
+    "galaxy_api_pulp_client_pool_idle_connections",
+    "number of idle keep-alive pulp API client connections in the pool"
+)
+
+pulp_fanout_width = Histogram(
+    "galaxy_api_pulp_fanout_width",
+    "number of pulp API calls issued concurrently by a single request",
+    buckets=(1, 2, 5, 10, 20, 50, 100)
+)
+
+pulp_fanout_duration = Histogram(
+    "galaxy_api_pulp_fanout_duration_seconds",
+    "time to complete all pulp API calls of a fan-out"
+)
+
+pulp_fanout_call_duration = Histogram(
+    "galaxy_api_pulp_fanout_call_duration_seconds",
+    "time to complete a single pulp API call of a fan-out"
+)
@@ -0,0 +1,73 @@
+import hashlib
+import uuid
+
+
+__all__ = (
+    'MultipartFileStream',
+)
+
+
+class MultipartFileStream:
+    """
+    A multipart/form-data request body streaming a single file.
+
+    The body is produced in chunks of at most ``chunk_size`` bytes, so
+    memory usage does not depend on file size. SHA256 digest of the file
+    is computed while streaming. If ``digest_field`` is given, the digest
+    is sent as a form field following the file.
+
+    Args:
+        fields: A list of (name, value) tuples sent before the file.
+        file_field: Name of the file field.
+        file: A django File object.
+        filename: File name sent with the file.
+        content_type: File content type.
+        chunk_size: Max size of a file chunk in bytes.
+        digest_field: Optional name of a field containing file SHA256 digest.
+    """
+
+    def __init__(self, fields, file_field, file, filename, content_type, *,
+                 chunk_size, digest_field=None):
+        self.boundary = uuid.uuid4().hex
+        self.file = file
+        self.chunk_size = chunk_size
+        self.digest_field = digest_field
+        self.sha256 = hashlib.sha256()
+
+        head = [self._encode_field(name, value) for name, value in fields]
+        head.append(self._encode_part_header(
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"',
+            f'Content-Type: {content_type}',
+        ))
+        self._head = b''.join(head)
+
+    @property
+    def content_type(self):
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    def __len__(self):
+        length = len(self._head) + self.file.size + len(b'\r\n') + len(self._encode_closing())
+        if self.digest_field:
+            length += len(self._encode_field(self.digest_field, '0' * 64))
+        return length
+
+    def __iter__(self):
+        yield self._head
+        for chunk in self.file.chunks(self.chunk_size):
+            self.sha256.update(chunk)
+            yield chunk
+        yield b'\r\n'
+        if self.digest_field:
+            yield self._encode_field(self.digest_field, self.sha256.hexdigest())
+        yield self._encode_closing()
+
+    def _encode_field(self, name, value):
+        header = self._encode_part_header(f'Content-Disposition: form-data; name="{name}"')
+        return header + str(value).encode('utf-8') + b'\r\n'
+
+    def _encode_part_header(self, *lines):
+        header = f'--{self.boundary}\r\n' + ''.join(line + '\r\n' for line in lines) + '\r\n'
+        return header.encode('utf-8')
+
+    def _encode_closing(self):
+        return f'--{self.boundary}--\r\n'.encode('utf-8')
@@ -1,5 +1,50 @@
+import functools
+import os
+import ssl
+import threading
+import time
+from concurrent import futures
+
+import certifi
+import galaxy_pulp
+import requests
+import urllib3
 from django.conf import settings
 from galaxy_pulp import Configuration, ApiClient
+from galaxy_pulp import rest
+
+from galaxy_ng.app.common import metrics
+from galaxy_ng.app.common import multipart
+
+
+CONTENT_CHUNK_SIZE_MIN = 64 * 1024
+CONTENT_CHUNK_SIZE_MAX = 1024 * 1024
+
+
+class _ProcessLocal:
+    """
+    A lazily created object shared by all threads of a process.
+
+    The object is created again after fork, since pooled sockets and
+    threads must not be shared between worker processes.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._value = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        pid = os.getpid()
+        if self._value is not None and self._pid == pid:
+            return self._value
+
+        with self._lock:
+            if self._value is None or self._pid != pid:
+                self._value = self._factory()
+                self._pid = pid
+        return self._value
 
 
 def get_configuration():
@@ -13,9 +58,234 @@ def get_configuration():
 
     )
     config.safe_chars_for_path_param = '/'
+    config.connection_pool_maxsize = settings.X_PULP_API_POOL_MAXSIZE
     return config
 
 
 def get_client():
+    """
+    Returns the process-wide pulp API client.
+
+    The client is shared between threads, so every request reuses the same
+    keep-alive connection pool.
+    """
+    return _client.get()
+
+
+def _create_client():
     config = get_configuration()
-    return ApiClient(configuration=config)
+    client = ApiClient(configuration=config)
+    pool_manager = _create_pool_manager(config)
+    client.rest_client.pool_manager = pool_manager
+    client.rest_client.request = _with_default_timeout(client.rest_client.request)
+
+    metrics.pulp_client_pool_connections_in_use.set_function(
+        lambda: _get_pool_stats(pool_manager)[0])
+    metrics.pulp_client_pool_idle_connections.set_function(
+        lambda: _get_pool_stats(pool_manager)[1])
+    return client
+
+
+_client = _ProcessLocal(_create_client)
+
+
+def _create_pool_manager(config):
+    """
+    Creates connection pool manager of the pulp API client.
+
+    Mirrors SSL and proxy options applied by galaxy_pulp.rest.RESTClientObject
+    and adds pool blocking and connect/read timeouts. The pool timeout
+    applies to requests made directly through the pool manager only.
+    """
+    connect_timeout, read_timeout = get_api_timeout()
+    pool_args = {
+        'maxsize': settings.X_PULP_API_POOL_MAXSIZE,
+        'block': settings.X_PULP_API_POOL_BLOCK,
+        'timeout': urllib3.Timeout(connect=connect_timeout, read=read_timeout),
+        'cert_reqs': ssl.CERT_REQUIRED if config.verify_ssl else ssl.CERT_NONE,
+        'ca_certs': config.ssl_ca_cert or certifi.where(),
+        'cert_file': config.cert_file,
+        'key_file': config.key_file,
+    }
+    if config.assert_hostname is not None:
+        pool_args['assert_hostname'] = config.assert_hostname
+    if getattr(config, 'retries', None) is not None:
+        pool_args['retries'] = config.retries
+
+    if config.proxy:
+        return urllib3.ProxyManager(
+            proxy_url=config.proxy,
+            proxy_headers=getattr(config, 'proxy_headers', None),
+            **pool_args
+        )
+    return urllib3.PoolManager(**pool_args)
+
+
+def get_api_timeout():
+    """Returns (connect, read) timeout of pulp API requests."""
+    return settings.X_PULP_API_CONNECT_TIMEOUT, settings.X_PULP_API_READ_TIMEOUT
+
+
+def _with_default_timeout(request):
+    """
+    Wraps RESTClientObject.request to apply the default pulp API timeout.
+
+    Generated API methods always pass ``_request_timeout``, which is None
+    unless given by the caller, and urllib3 treats an explicit None as no
+    timeout, overriding the timeout of the pool manager.
+    """
+    @functools.wraps(request)
+    def wrapper(*args, _request_timeout=None, **kwargs):
+        if _request_timeout is None:
+            _request_timeout = get_api_timeout()
+        return request(*args, _request_timeout=_request_timeout, **kwargs)
+    return wrapper
+
+
+def _get_pool_stats(pool_manager):
+    """Returns number of connections in use and idle connections in all pools."""
+    in_use = idle = 0
+    with pool_manager.pools.lock:
+        pools = list(pool_manager.pools._container.values())
+    for pool in pools:
+        if pool.pool is None:
+            continue
+        # NOTE: Connection pool queue is pre-filled with None placeholders
+        # for connections that are not opened yet.
+        queued = list(pool.pool.queue)
+        in_use += pool.pool.maxsize - len(queued)
+        idle += sum(1 for conn in queued if conn is not None)
+    return in_use, idle
+
+
+def get_executor():
+    """Returns the process-wide thread pool used for concurrent pulp API calls."""
+    return _executor.get()
+
+
+def _create_executor():
+    return futures.ThreadPoolExecutor(
+        max_workers=settings.X_PULP_API_FANOUT_WORKERS,
+        thread_name_prefix='pulp-fanout',
+    )
+
+
+_executor = _ProcessLocal(_create_executor)
+
+
+def fan_out(func, items):
+    """
+    Calls ``func`` for each item concurrently using a bounded thread pool.
+
+    Returns a list of results in the order of ``items``. An exception raised
+    by a call is returned in place of its result, so that a single failed
+    call does not fail the others.
+    """
+    items = list(items)
+    metrics.pulp_fanout_width.observe(len(items))
+
+    start = time.monotonic()
+    if len(items) <= 1:
+        results = [_call_isolated(func, item) for item in items]
+    else:
+        executor = get_executor()
+        results = list(executor.map(lambda item: _call_isolated(func, item), items))
+    metrics.pulp_fanout_duration.observe(time.monotonic() - start)
+    return results
+
+
+def _call_isolated(func, item):
+    with metrics.pulp_fanout_call_duration.time():
+        try:
+            return func(item)
+        except Exception as exc:
+            return exc
+
+
+def get_content_session():
+    """Returns the process-wide requests session for the pulp content app."""
+    return _content_session.get()
+
+
+def _create_content_session():
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_maxsize=settings.X_PULP_CONTENT_POOL_MAXSIZE,
+        pool_block=settings.X_PULP_CONTENT_POOL_BLOCK,
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_content_session = _ProcessLocal(_create_content_session)
+
+
+def get_content_timeout():
+    """Returns (connect, read) timeout of content app requests."""
+    return settings.X_PULP_CONTENT_CONNECT_TIMEOUT, settings.X_PULP_CONTENT_READ_TIMEOUT
+
+
+def get_content_chunk_size():
+    """Returns content app streaming chunk size limited to a sane range."""
+    return min(max(settings.X_PULP_CONTENT_CHUNK_SIZE, CONTENT_CHUNK_SIZE_MIN),
+               CONTENT_CHUNK_SIZE_MAX)
+
+
+def post_collection_artifact(file, filename, mimetype, sha256=None):
+    """
+    Streams collection artifact to pulp collection upload endpoint.
+
+    The artifact is sent in chunks of X_PULP_API_UPLOAD_CHUNK_SIZE bytes
+    and never loaded into memory as a whole. If ``sha256`` is not provided,
+    the digest computed while streaming is sent after the file, so pulp
+    still verifies integrity of the received artifact.
+
+    Args:
+        file: Uploaded collection artifact.
+        filename: CollectionFilename of the artifact.
+        mimetype: Artifact content type.
+        sha256: Optional expected artifact digest.
+
+    Returns:
+        galaxy_pulp.rest.RESTResponse: Pulp response.
+
+    Raises:
+        galaxy_pulp.ApiException: If pulp responds with an error.
+    """
+    client = get_client()
+    url = '{host}/{prefix}/{path}'.format(
+        host=client.configuration.host,
+        path='v3/artifacts/collections/',
+        prefix=settings.X_PULP_API_PREFIX
+    )
+
+    fields = [
+        ('expected_namespace', filename.namespace),
+        ('expected_name', filename.name),
+        ('expected_version', filename.version),
+    ]
+    if sha256:
+        fields.append(('sha256', sha256))
+
+    body = multipart.MultipartFileStream(
+        fields, 'file', file, os.path.basename(file.name), mimetype,
+        chunk_size=settings.X_PULP_API_UPLOAD_CHUNK_SIZE,
+        digest_field=None if sha256 else 'sha256',
+    )
+
+    headers = {}
+    headers.update(client.default_headers)
+    headers.update({
+        'Content-Type': body.content_type,
+        'Content-Length': str(len(body)),
+    })
+    client.update_params_for_auth(headers, tuple(), client.configuration.auth_settings())
+
+    # NOTE: Streamed body cannot be replayed, so retries are disabled.
+    response = rest.RESTResponse(client.rest_client.pool_manager.urlopen(
+        'POST', url, body=body, headers=headers, retries=False,
+    ))
+    if not 200 <= response.status <= 299:
+        raise galaxy_pulp.ApiException(http_resp=response)
+    return response
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from galaxy_ng.app import tasks
+
+
+class Command(BaseCommand):
+    """Reconciles local collection index with collections in pulp."""
+
+    help = 'Reconciles local collection index with collections in pulp.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page-size', type=int, default=100,
+                            help='Number of collections fetched from pulp per request.')
+
+    def handle(self, *args, **options):
+        tasks.reconcile_collection_index(page_size=options['page_size'])
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from galaxy_ng.app import tasks
+
+
+class Command(BaseCommand):
+    """Mirrors state of all unfinished collection imports from pulp."""
+
+    help = 'Mirrors state of all unfinished collection imports from pulp.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help='Number of imports refreshed concurrently.')
+
+    def handle(self, *args, **options):
+        tasks.sync_collection_imports(batch_size=options['batch_size'])
@@ -0,0 +1,44 @@
+# Generated by Django 2.2.10 on 2020-03-02 10:14
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('galaxy', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collectionimport',
+            name='compressed_messages',
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AddField(
+            model_name='collectionimport',
+            name='error',
+            field=django.contrib.postgres.fields.jsonb.JSONField(null=True),
+        ),
+        migrations.AddField(
+            model_name='collectionimport',
+            name='finished_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name='collectionimport',
+            name='started_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name='collectionimport',
+            name='state',
+            field=models.CharField(db_index=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='collectionimport',
+            name='updated_at',
+            field=models.DateTimeField(null=True),
+        ),
+    ]
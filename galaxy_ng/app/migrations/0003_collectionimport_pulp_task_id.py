@@ -0,0 +1,24 @@
+# Generated by Django 2.2.10 on 2020-03-05 14:32
+
+from django.db import migrations, models
+
+
+def set_pulp_task_id(apps, schema_editor):
+    CollectionImport = apps.get_model('galaxy', 'CollectionImport')
+    CollectionImport.objects.update(pulp_task_id=models.F('task_id'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('galaxy', '0002_collectionimport_task_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collectionimport',
+            name='pulp_task_id',
+            field=models.UUIDField(null=True),
+        ),
+        migrations.RunPython(set_pulp_task_id, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 2.2.10 on 2020-03-11 09:47
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE FUNCTION galaxy_namespace_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.company, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER galaxy_namespace_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, company, description
+    ON galaxy_namespace
+    FOR EACH ROW EXECUTE PROCEDURE galaxy_namespace_search_vector_update();
+
+UPDATE galaxy_namespace SET name = name;
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER = """
+DROP TRIGGER IF EXISTS galaxy_namespace_search_vector_trigger ON galaxy_namespace;
+DROP FUNCTION IF EXISTS galaxy_namespace_search_vector_update();
+"""
+
+# Matches UPPER(name::text) LIKE UPPER(...) generated for name__icontains
+NAME_TRIGRAM_INDEX = """
+CREATE INDEX galaxy_namespace_name_trgm_idx
+    ON galaxy_namespace USING gin (UPPER(name::text) gin_trgm_ops);
+"""
+
+DROP_NAME_TRIGRAM_INDEX = """
+DROP INDEX IF EXISTS galaxy_namespace_name_trgm_idx;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('galaxy', '0004_token'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='namespace',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='namespace',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='galaxy_namespace_search_idx'),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_TRIGGER, DROP_SEARCH_VECTOR_TRIGGER),
+        migrations.RunSQL(NAME_TRIGRAM_INDEX, DROP_NAME_TRIGRAM_INDEX),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 2.2.10 on 2020-03-13 16:21
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.fields.jsonb
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE FUNCTION galaxy_collectionindex_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.namespace, '')), 'A') ||
+        setweight(to_tsvector('simple', array_to_string(NEW.tags, ' ')), 'B') ||
+        setweight(to_tsvector('simple', array_to_string(NEW.contents, ' ')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER galaxy_collectionindex_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF namespace, name, description, tags, contents
+    ON galaxy_collectionindex
+    FOR EACH ROW EXECUTE PROCEDURE galaxy_collectionindex_search_vector_update();
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER = """
+DROP TRIGGER IF EXISTS galaxy_collectionindex_search_vector_trigger ON galaxy_collectionindex;
+DROP FUNCTION IF EXISTS galaxy_collectionindex_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('galaxy', '0005_namespace_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CollectionIndex',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('namespace', models.CharField(max_length=64)),
+                ('name', models.CharField(max_length=64)),
+                ('version', models.CharField(max_length=32)),
+                ('description', models.TextField(blank=True)),
+                ('tags', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=64), default=list, size=None)),
+                ('contents', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=256), default=list, size=None)),
+                ('certification', models.CharField(db_index=True, max_length=16)),
+                ('deprecated', models.BooleanField(default=False)),
+                ('pulp_created', models.DateTimeField()),
+                ('data', django.contrib.postgres.fields.jsonb.JSONField()),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('namespace', 'name')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='collectionindex',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='galaxy_collidx_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='collectionindex',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tags'], name='galaxy_collidx_tags_idx'),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_TRIGGER, DROP_SEARCH_VECTOR_TRIGGER),
+    ]
@@ -1,10 +1,14 @@
 from .auth import (
     Group,
+    Token,
     User,
 )
 from .collectionimport import (
     CollectionImport,
 )
+from .collectionindex import (
+    CollectionIndex,
+)
 from .namespace import (
     Namespace,
     NamespaceLink,
@@ -13,8 +17,10 @@ from .namespace import (
 
 __all__ = (
     'Group',
+    'Token',
     'User',
     'CollectionImport',
+    'CollectionIndex',
     'Namespace',
     'NamespaceLink',
 )
@@ -1,4 +1,9 @@
+import hashlib
+import secrets
+
+from django.conf import settings
 from django.contrib.auth import models as auth_models
+from django.db import models
 
 
 __all__ = (
@@ -6,6 +11,7 @@ __all__ = (
     'RH_PARTNER_ENGINEER_GROUP',
     'User',
     'Group',
+    'Token',
 )
 
 
@@ -35,3 +41,51 @@ class Group(auth_models.Group):
 
     class Meta:
         proxy = True
+
+
+class TokenManager(models.Manager):
+    def create_token(self, user, name=''):
+        """
+        Creates a new API token for user.
+
+        Returns a tuple of created token and its key. The key is not
+        stored and cannot be retrieved later.
+        """
+        key = secrets.token_hex(20)
+        token = self.create(user=user, name=name, digest=self.make_digest(key), prefix=key[:8])
+        return token, key
+
+    @staticmethod
+    def make_digest(key):
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+class Token(models.Model):
+    """
+    An API token of a user.
+
+    Keys are random, so a single SHA256 digest is sufficient to store them
+    safely and allows looking tokens up by index.
+
+    Fields:
+        digest: SHA256 digest of the token key.
+        prefix: First characters of the key to help users identify tokens.
+        name: Optional token description.
+        created_at: Token creation date time.
+
+    Relations:
+        user: Reference to token owner.
+    """
+
+    digest = models.CharField(max_length=64, unique=True, editable=False)
+    prefix = models.CharField(max_length=8, editable=False)
+    name = models.CharField(max_length=64, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='tokens')
+
+    objects = TokenManager()
+
+    class Meta:
+        ordering = ['-created_at']
@@ -1,3 +1,7 @@
+import json
+import zlib
+
+from django.contrib.postgres.fields import JSONField
 from django.db import models
 from django.urls import reverse
 
@@ -13,16 +17,37 @@ class CollectionImport(models.Model):
     """
     A model representing a mapping between pulp task id and task parameters.
 
+    Task state fields mirror the pulp import task. Once the task reaches
+    one of ``FINISHED_STATES`` the mirror never changes and is served
+    without querying pulp.
+
+    Imports of artifacts uploaded synchronously use pulp task id as
+    ``task_id``. Imports of artifacts staged for a background upload are
+    created with a local ``task_id`` in ``waiting`` state and get
+    ``pulp_task_id`` once the artifact is handed off to pulp.
+
     Fields:
         task_id: Task UUID.
+        pulp_task_id: Pulp import task UUID.
         created_at: Task creation date time.
         name: Collection name.
         version: Collection version.
+        state: Last known task state.
+        updated_at: Task last update date time.
+        started_at: Task start date time.
+        finished_at: Task finish date time.
+        error: Task error details.
+        compressed_messages: zlib compressed JSON list of task messages.
 
     Relations:
         namespace: Reference to a namespace.
     """
+    WAITING_STATE = 'waiting'
+    FAILED_STATE = 'failed'
+    FINISHED_STATES = ('completed', 'failed', 'canceled')
+
     task_id = models.UUIDField(primary_key=True)
+    pulp_task_id = models.UUIDField(null=True)
 
     created_at = models.DateTimeField()
 
@@ -30,8 +55,54 @@ class CollectionImport(models.Model):
     name = models.CharField(max_length=64, editable=False)
     version = models.CharField(max_length=32, editable=False)
 
+    state = models.CharField(max_length=32, null=True, db_index=True)
+    updated_at = models.DateTimeField(null=True)
+    started_at = models.DateTimeField(null=True)
+    finished_at = models.DateTimeField(null=True)
+    error = JSONField(null=True)
+    compressed_messages = models.BinaryField(null=True)
+
     class Meta:
         ordering = ['-task_id']
 
+    @property
+    def id(self):
+        return self.task_id
+
+    @property
+    def is_finished(self):
+        return self.state in self.FINISHED_STATES
+
+    @property
+    def messages(self):
+        if self.compressed_messages is None:
+            return None
+        return json.loads(zlib.decompress(self.compressed_messages))
+
+    @messages.setter
+    def messages(self, value):
+        if value is None:
+            self.compressed_messages = None
+        else:
+            self.compressed_messages = zlib.compress(
+                json.dumps(value, default=str).encode('utf-8'))
+
+    def update_from_task(self, task_info):
+        """
+        Updates mirrored task state from pulp import task.
+
+        Returns True if the state has changed and the object must be saved.
+        """
+        if self.is_finished or self.updated_at == task_info.updated_at:
+            return False
+
+        self.state = task_info.state
+        self.updated_at = task_info.updated_at
+        self.started_at = task_info.started_at
+        self.finished_at = task_info.finished_at
+        self.error = task_info.error
+        self.messages = task_info.messages
+        return True
+
     def get_absolute_url(self):
         return reverse('galaxy:api:v3:collection-import', args=[str(self.task_id)])
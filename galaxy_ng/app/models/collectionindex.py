@@ -0,0 +1,69 @@
+from django.contrib.postgres.fields import ArrayField, JSONField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+
+__all__ = (
+    "CollectionIndex",
+)
+
+
+class CollectionIndex(models.Model):
+    """
+    A model representing the highest version of a collection mirrored from pulp.
+
+    Used to search, filter and sort collections locally. Rows are refreshed
+    when collection content changes and reconciled with pulp periodically.
+
+    Fields:
+        namespace: Collection namespace name.
+        name: Collection name.
+        version: Highest collection version.
+        description: Collection description.
+        tags: Collection tag names.
+        contents: Collection content names.
+        certification: Certification status of the highest version.
+        deprecated: Whether the collection is deprecated.
+        pulp_created: Highest version creation date time.
+        data: Pulp collection version representation without docs blob.
+        search_vector: Full-text search document. Maintained by a
+            database trigger.
+        updated_at: Last refresh date time.
+    """
+
+    namespace = models.CharField(max_length=64)
+    name = models.CharField(max_length=64)
+    version = models.CharField(max_length=32)
+    description = models.TextField(blank=True)
+    tags = ArrayField(models.CharField(max_length=64), default=list)
+    contents = ArrayField(models.CharField(max_length=256), default=list)
+    certification = models.CharField(max_length=16, db_index=True)
+    deprecated = models.BooleanField(default=False)
+    pulp_created = models.DateTimeField()
+    data = JSONField()
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('namespace', 'name')
+        indexes = [
+            GinIndex(fields=['search_vector'], name='galaxy_collidx_search_idx'),
+            GinIndex(fields=['tags'], name='galaxy_collidx_tags_idx'),
+        ]
+
+    @staticmethod
+    def values_from_pulp(collection):
+        """Returns field values of a pulp collection version representation."""
+        return {
+            'namespace': collection['namespace'],
+            'name': collection['name'],
+            'version': collection['version'],
+            'description': collection.get('description') or '',
+            'tags': [tag['name'] for tag in collection.get('tags') or []],
+            'contents': [content['name'] for content in collection.get('contents') or []],
+            'certification': collection['certification'],
+            'deprecated': bool(collection.get('deprecated')),
+            'pulp_created': collection['pulp_created'],
+            'data': collection,
+        }
@@ -1,6 +1,10 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.db import transaction
 
+from galaxy_ng.app.common import cache
+
 from . import auth as auth_models
 
 
@@ -19,6 +23,8 @@ class Namespace(models.Model):
         avatar_url: Optional namespace logo URL.
         description: Namespace brief description.
         resources: Namespace resources page in markdown format.
+        search_vector: Full-text search document of name, company and
+            description. Maintained by a database trigger.
 
     Relations:
         owners: Reference to namespace owners.
@@ -34,21 +40,66 @@ class Namespace(models.Model):
     avatar_url = models.URLField(max_length=256, blank=True)
     description = models.CharField(max_length=256, blank=True)
     resources = models.TextField(blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     # References
     groups = models.ManyToManyField(auth_models.Group, related_name="namespaces")
 
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='galaxy_namespace_search_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        transaction.on_commit(cache.invalidate_namespaces)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        transaction.on_commit(cache.invalidate_namespaces)
+        return result
+
     @transaction.atomic
     def set_links(self, links):
-        """Replace namespace related links with new ones."""
-        self.links.all().delete()
-        self.links.bulk_create(
-            NamespaceLink(name=link["name"], url=link["url"], namespace=self)
-            for link in links
-        )
+        """
+        Replace namespace related links with new ones.
+
+        Only the difference is written. Existing links equal to new ones
+        are kept, remaining existing links are updated in place with
+        remaining new values, and the rest are deleted or created.
+        """
+        wanted = [(link["name"], link["url"]) for link in links]
+
+        unmatched = []
+        for link in self.links.all():
+            try:
+                wanted.remove((link.name, link.url))
+            except ValueError:
+                unmatched.append(link)
+
+        changed = []
+        for link, (name, url) in zip(unmatched, wanted):
+            link.name = name
+            link.url = url
+            changed.append(link)
+        removed = unmatched[len(changed):]
+        created = [
+            NamespaceLink(name=name, url=url, namespace=self)
+            for name, url in wanted[len(changed):]
+        ]
+
+        if removed:
+            NamespaceLink.objects.filter(pk__in=[link.pk for link in removed]).delete()
+        if changed:
+            NamespaceLink.objects.bulk_update(changed, ["name", "url"])
+        if created:
+            NamespaceLink.objects.bulk_create(created)
+
+        if removed or changed or created:
+            transaction.on_commit(cache.invalidate_namespaces)
 
 
 class NamespaceLink(models.Model):
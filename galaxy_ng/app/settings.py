@@ -10,16 +10,64 @@ GALAXY_API_PATH_PREFIX = "/api/galaxy"
 
 GALAXY_EXCEPTION_HANDLER = "galaxy_ng.app.api.exceptions.exception_handler"
 GALAXY_PAGINATION_CLASS = "galaxy_ng.app.api.pagination.LimitOffsetPagination"
+# Default count mode of paginated local listings: "exact", "estimate" or "none"
+GALAXY_PAGINATION_COUNT_MODE = "exact"
 GALAXY_AUTHENTICATION_CLASSES = [
     "rest_framework.authentication.SessionAuthentication",
+    "galaxy_ng.app.auth.auth.TokenAuthentication",
     "rest_framework.authentication.BasicAuthentication",
     # "galaxy_ng.app.auth.auth.RHIdentityAuthentication",
 ]
+GALAXY_RENDERER_CLASSES = [
+    "galaxy_ng.app.api.renderers.JSONRenderer",
+    "rest_framework.renderers.BrowsableAPIRenderer",
+]
 GALAXY_PERMISSION_CLASSES = [
     'rest_framework.permissions.IsAuthenticated',
     # 'galaxy_ng.app.auth.auth.RHEntitlementRequired',
 ]
 
+# Caching
+# -------
+# "lru" keeps entries in an in-process LRU cache, "django" uses a django
+# cache selected by GALAXY_CACHE_ALIAS. Only a cache shared between workers
+# (e.g. redis or memcached) propagates invalidation to all processes.
+GALAXY_CACHE_BACKEND = "lru"
+GALAXY_CACHE_ALIAS = "default"
+GALAXY_CACHE_MAX_ENTRIES = 1024
+# Seconds to cache collection listings proxied from pulp, 0 disables caching.
+GALAXY_COLLECTION_CACHE_TTL = 0
+# Seconds to cache users authenticated by identity header, 0 disables caching.
+GALAXY_IDENTITY_CACHE_TTL = 60
+# Seconds to cache user group names used by permission checks, 0 disables caching.
+GALAXY_GROUP_CACHE_TTL = 0
+# Seconds to cache namespace summaries embedded in UI collection responses,
+# 0 disables caching. Namespace changes made in other processes are visible
+# after up to this time with the "lru" backend.
+GALAXY_NAMESPACE_CACHE_TTL = 30
+# Emit ETag/Last-Modified on collection read endpoints and answer conditional
+# requests with 304. Validators are derived from the collections content
+# version, so this requires a shared cache backend.
+GALAXY_CONDITIONAL_GET = False
+# Seconds after which conditional GET validators change even if content
+# version did not, bounding staleness of changes missed by a process-local
+# content version. 0 keeps validators until content version changes.
+GALAXY_CONDITIONAL_GET_MAX_AGE = 60
+# Mirror highest collection versions from pulp into a local index and serve
+# UI collection search from it. Run "django-admin reconcile_collection_index"
+# periodically to repair drift from changes made directly in pulp.
+GALAXY_COLLECTION_INDEX = False
+# Cache-Control header values of read endpoints, e.g.
+# {"v3-collection-list": "public, max-age=60"}. Endpoints are "v3-collection-list",
+# "v3-collection", "v3-collection-version-list", "v3-collection-version" and "ui-tags".
+GALAXY_CACHE_CONTROL = {}
+# Name of the response header carrying surrogate keys of read endpoints
+# (e.g. "Surrogate-Key"), None disables surrogate keys.
+GALAXY_SURROGATE_KEY_HEADER = None
+# Import path of a function called with a list of surrogate keys to purge
+# from the caching proxy after collection content changes.
+GALAXY_SURROGATE_PURGE_HOOK = None
+
 
 # Compatibility settings
 # ----------------------
@@ -31,7 +79,42 @@ X_PULP_API_PORT = 8000
 X_PULP_API_USER = "admin"
 X_PULP_API_PASSWORD = "admin"
 X_PULP_API_PREFIX = "pulp_ansible/galaxy/automation-hub/api"
+# Connection pool of the process-wide pulp API client, shared by request
+# threads and fan-out workers of a worker process. Should not be lower than
+# GUNICORN_THREADS (16) plus X_PULP_API_FANOUT_WORKERS (10), otherwise
+# connections above the pool size are closed after use instead of kept alive.
+X_PULP_API_POOL_MAXSIZE = 26
+X_PULP_API_POOL_BLOCK = False
+X_PULP_API_CONNECT_TIMEOUT = 5.0
+X_PULP_API_READ_TIMEOUT = 60.0
+# Max number of concurrent pulp API calls issued by a worker process
+X_PULP_API_FANOUT_WORKERS = 10
+# Size of chunks used to stream uploaded collection artifacts to pulp
+X_PULP_API_UPLOAD_CHUNK_SIZE = 64 * 1024
 
 X_PULP_CONTENT_HOST = "pulp-content"
 X_PULP_CONTENT_PORT = 24816
 X_PULP_CONTENT_PATH_PREFIX = f"/{GALAXY_API_PATH_PREFIX}/v3/artifacts/collections/"
+# Connection pool of the process-wide content app session
+X_PULP_CONTENT_POOL_MAXSIZE = 16
+X_PULP_CONTENT_POOL_BLOCK = False
+X_PULP_CONTENT_CONNECT_TIMEOUT = 5.0
+X_PULP_CONTENT_READ_TIMEOUT = 60.0
+# Size of chunks used to stream artifacts from the content app,
+# limited to the range from 64 KiB to 1 MiB
+X_PULP_CONTENT_CHUNK_SIZE = 256 * 1024
+
+# Offload artifact downloads to the front proxy. When set to a header name
+# (e.g. "X-Accel-Redirect" for nginx), downloads respond with this header
+# pointing at GALAXY_DOWNLOAD_OFFLOAD_PREFIX, an internal front proxy location
+# routed to the pulp content app, instead of streaming through django.
+GALAXY_DOWNLOAD_OFFLOAD_HEADER = None
+GALAXY_DOWNLOAD_OFFLOAD_PREFIX = "/_pulp_content"
+
+# Hand off uploaded artifacts to pulp in a background task. Uploads are
+# staged in default file storage under GALAXY_UPLOAD_STAGING_DIR and answered
+# with 202 straight away. The directory is relative to MEDIA_ROOT and must be
+# shared between API and pulp worker hosts, e.g. the "galaxy_uploads" volume
+# mounted at /var/lib/pulp/galaxy_ng/uploads in dev/docker-compose.yml.
+GALAXY_UPLOAD_ASYNC = False
+GALAXY_UPLOAD_STAGING_DIR = "galaxy_ng/uploads"
@@ -1,2 +1,3 @@
-from .publishing import publish  # noqa
-from .synchronizing import synchronize  # noqa
+from .collection_index import refresh_collection_index, reconcile_collection_index  # noqa
+from .imports import refresh_collection_imports, sync_collection_imports  # noqa
+from .publishing import publish_collection_artifact, stage_collection_artifact  # noqa
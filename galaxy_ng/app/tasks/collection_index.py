@@ -0,0 +1,137 @@
+import json
+import logging
+
+import galaxy_pulp
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from galaxy_ng.app import models
+from galaxy_ng.app.common import pulp
+
+
+log = logging.getLogger(__name__)
+
+
+def _list_highest_versions(**params):
+    api = galaxy_pulp.PulpCollectionsApi(pulp.get_client())
+    response = api.list(
+        is_highest=True,
+        exclude_fields='docs_blob',
+        _preload_content=False,
+        **params
+    )
+    return json.loads(response.data)
+
+
+def _save_collections(collections):
+    """
+    Creates or updates index rows of pulp collection versions.
+
+    Rows whose pulp representation has not changed are left untouched.
+    """
+    if not collections:
+        return
+
+    keys = {(collection['namespace'], collection['name']) for collection in collections}
+    existing = {
+        (row.namespace, row.name): row
+        for row in models.CollectionIndex.objects.filter(
+            namespace__in={namespace for namespace, _ in keys},
+            name__in={name for _, name in keys},
+        ).only('namespace', 'name', 'data')
+    }
+
+    with transaction.atomic():
+        for collection in collections:
+            row = existing.get((collection['namespace'], collection['name']))
+            if row is not None and row.data == collection:
+                continue
+            values = models.CollectionIndex.values_from_pulp(collection)
+            models.CollectionIndex.objects.update_or_create(
+                namespace=values.pop('namespace'),
+                name=values.pop('name'),
+                defaults=values,
+            )
+
+
+def _refresh_collections(collections):
+    """
+    Refreshes index rows of collections from pulp.
+
+    Returns number of removed rows.
+    """
+    responses = pulp.fan_out(
+        lambda collection: _list_highest_versions(
+            namespace=collection[0], name=collection[1]),
+        collections,
+    )
+
+    found = []
+    removed = 0
+    for (namespace, name), response in zip(collections, responses):
+        if isinstance(response, Exception):
+            log.warning('Failed to refresh collection index of %s.%s: %s',
+                        namespace, name, response)
+        elif response['results']:
+            found.append(response['results'][0])
+        else:
+            models.CollectionIndex.objects.filter(namespace=namespace, name=name).delete()
+            removed += 1
+
+    _save_collections(found)
+    return removed
+
+
+def refresh_collection_index(collections):
+    """
+    Refreshes index rows of collections from pulp.
+
+    Does nothing unless GALAXY_COLLECTION_INDEX setting is enabled.
+    Failure to get a single collection is logged and leaves its row in
+    place until the next reconciliation.
+
+    Args:
+        collections: An iterable of (namespace, name) tuples.
+    """
+    if not settings.GALAXY_COLLECTION_INDEX:
+        return
+
+    _refresh_collections(list(set(collections)))
+
+
+def reconcile_collection_index(page_size=100):
+    """
+    Reconciles collection index with all highest collection versions in pulp.
+
+    Pages of pulp collections are fetched concurrently. Any failure aborts
+    reconciliation before rows are removed. Limit/offset pages shift when
+    collections are added or removed meanwhile, so rows missing from the
+    pages are refreshed one by one and removed only if pulp no longer has
+    them. Rows refreshed after reconciliation started are left untouched.
+    """
+    started_at = timezone.now()
+
+    first_page = _list_highest_versions(offset=0, limit=page_size)
+    pages = pulp.fan_out(
+        lambda offset: _list_highest_versions(offset=offset, limit=page_size),
+        range(page_size, first_page['count'], page_size),
+    )
+    for page in pages:
+        if isinstance(page, Exception):
+            raise page
+
+    seen = set()
+    for page in [first_page] + pages:
+        _save_collections(page['results'])
+        seen.update((collection['namespace'], collection['name'])
+                    for collection in page['results'])
+
+    rows = models.CollectionIndex.objects.filter(updated_at__lt=started_at)
+    missing = [
+        (namespace, name) for namespace, name
+        in rows.values_list('namespace', 'name').iterator()
+        if (namespace, name) not in seen
+    ]
+    removed = _refresh_collections(missing)
+    log.info('Reconciled collection index: %d collections, %d removed', len(seen), removed)
@@ -0,0 +1,69 @@
+import logging
+
+import galaxy_pulp
+from django.conf import settings
+
+from galaxy_ng.app import models
+from galaxy_ng.app.common import cache
+from galaxy_ng.app.common import pulp
+
+from .collection_index import refresh_collection_index
+
+
+log = logging.getLogger(__name__)
+
+
+def refresh_collection_imports(imports):
+    """
+    Updates task state mirror of unfinished collection imports from pulp.
+
+    Finished imports and imports not yet handed off to pulp are skipped.
+    Failure to get a single task is logged and leaves its last known state
+    in place.
+    """
+    unfinished = [
+        import_obj for import_obj in imports
+        if not import_obj.is_finished and import_obj.pulp_task_id is not None
+    ]
+    if not unfinished:
+        return
+
+    api = galaxy_pulp.GalaxyImportsApi(pulp.get_client())
+    task_infos = pulp.fan_out(
+        lambda import_obj: api.get(
+            prefix=settings.X_PULP_API_PREFIX, id=str(import_obj.pulp_task_id)),
+        unfinished,
+    )
+
+    completed = set()
+    for import_obj, task_info in zip(unfinished, task_infos):
+        if isinstance(task_info, Exception):
+            log.warning('Failed to get pulp import task %s: %s', import_obj.pk, task_info)
+            continue
+        if import_obj.update_from_task(task_info):
+            import_obj.save()
+            if import_obj.state == 'completed':
+                completed.add((import_obj.namespace.name, import_obj.name))
+
+    # Imported collection versions become visible once the task completes
+    if completed:
+        cache.invalidate_collections(completed)
+        refresh_collection_index(completed)
+
+
+def sync_collection_imports(batch_size=100):
+    """
+    Mirrors state of all unfinished collection imports from pulp.
+
+    Run by "django-admin sync_collection_imports". Also fills in state of
+    imports created before task state was mirrored.
+    """
+    queryset = models.CollectionImport.objects.exclude(
+        state__in=models.CollectionImport.FINISHED_STATES
+    ).order_by('created_at')
+
+    task_ids = list(queryset.values_list('task_id', flat=True))
+    for idx in range(0, len(task_ids), batch_size):
+        batch = models.CollectionImport.objects.filter(
+            task_id__in=task_ids[idx:idx + batch_size])
+        refresh_collection_imports(batch)
@@ -0,0 +1,116 @@
+import json
+import logging
+import os
+import uuid
+
+import galaxy_pulp
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+from pulpcore.plugin.tasking import enqueue_with_reservation
+
+from galaxy_ng.app import models
+from galaxy_ng.app.api.utils import CollectionFilename
+from galaxy_ng.app.common import cache
+from galaxy_ng.app.common import metrics
+from galaxy_ng.app.common import pulp
+
+
+log = logging.getLogger(__name__)
+
+
+def stage_collection_artifact(file, filename, namespace, mimetype, sha256=None):
+    """
+    Stages uploaded collection artifact for publishing to pulp.
+
+    The artifact is saved to GALAXY_UPLOAD_STAGING_DIR and a collection
+    import in ``waiting`` state is created. Publishing task is enqueued
+    once the transaction commits.
+
+    Returns:
+        CollectionImport: Created collection import.
+    """
+    import_obj = models.CollectionImport(
+        task_id=uuid.uuid4(),
+        created_at=timezone.now(),
+        namespace=namespace,
+        name=filename.name,
+        version=filename.version,
+        state=models.CollectionImport.WAITING_STATE,
+    )
+    path = default_storage.save(
+        os.path.join(settings.GALAXY_UPLOAD_STAGING_DIR, str(import_obj.task_id), file.name),
+        file,
+    )
+    try:
+        import_obj.save(force_insert=True)
+    except Exception:
+        default_storage.delete(path)
+        raise
+
+    transaction.on_commit(lambda: enqueue_with_reservation(
+        publish_collection_artifact,
+        [str(import_obj.task_id)],
+        kwargs={
+            'import_pk': str(import_obj.task_id),
+            'path': path,
+            'mimetype': mimetype,
+            'sha256': sha256,
+        },
+    ))
+    return import_obj
+
+
+def publish_collection_artifact(import_pk, path, mimetype, sha256=None):
+    """
+    Publishes staged collection artifact to pulp.
+
+    Records pulp import task of the collection import. If publishing
+    fails, the collection import fails with the error. The staged artifact
+    is removed in either case.
+    """
+    import_obj = models.CollectionImport.objects.select_related('namespace').get(pk=import_pk)
+    filename = CollectionFilename(import_obj.namespace.name, import_obj.name, import_obj.version)
+
+    try:
+        with default_storage.open(path) as file:
+            upload_response = pulp.post_collection_artifact(
+                file, filename, mimetype, sha256=sha256)
+    except Exception as exc:
+        log.exception('Failed to publish staged artifact %s of collection import %s to pulp',
+                      path, import_pk)
+        import_obj.state = models.CollectionImport.FAILED_STATE
+        import_obj.finished_at = timezone.now()
+        import_obj.error = _get_error(exc)
+        import_obj.save()
+        raise
+    finally:
+        default_storage.delete(path)
+
+    task_href = json.loads(upload_response.data)['task']
+    task_detail = pulp.get_client().call_api(
+        task_href,
+        'GET',
+        auth_settings=['BasicAuth'],
+        response_type='CollectionImport',
+        _return_http_data_only=True,
+    )
+    log.info('Publishing of staged artifact %s created pulp import task_id=%s',
+             path, task_detail.id)
+
+    import_obj.pulp_task_id = task_detail.id
+    import_obj.update_from_task(task_detail)
+    import_obj.save()
+
+    cache.invalidate_collections([(filename.namespace, filename.name)])
+    metrics.collection_import_successes.inc()
+
+
+def _get_error(exc):
+    if isinstance(exc, galaxy_pulp.ApiException):
+        body = exc.body
+        if isinstance(body, bytes):
+            body = body.decode('utf-8', errors='replace')
+        return {'code': str(exc.status), 'description': body or exc.reason}
+    return {'code': type(exc).__name__, 'description': str(exc)}
@@ -0,0 +1,37 @@
+import timeit
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from galaxy_ng.app.api import url_builder
+
+
+class TestUrlBuilderBenchmark(SimpleTestCase):
+    """Compare cost of building hrefs of a 100 items collection page."""
+
+    PAGE_SIZE = 100
+    REPEAT = 20
+
+    def _build_page_reverse(self):
+        for i in range(self.PAGE_SIZE):
+            kwargs = dict(namespace='namespace', name=f'collection_{i}')
+            reverse('galaxy:api:v3:collection', kwargs=kwargs)
+            reverse('galaxy:api:v3:collection-version-list', kwargs=kwargs)
+            reverse('galaxy:api:v3:collection-version', kwargs=dict(kwargs, version='1.0.0'))
+
+    def _build_page_templates(self):
+        for i in range(self.PAGE_SIZE):
+            name = f'collection_{i}'
+            url_builder.collection_href('namespace', name)
+            url_builder.collection_versions_href('namespace', name)
+            url_builder.collection_version_href('namespace', name, '1.0.0')
+
+    def test_benchmark(self):
+        self._build_page_templates()
+        reverse_time = min(timeit.repeat(self._build_page_reverse, number=1, repeat=self.REPEAT))
+        template_time = min(timeit.repeat(
+            self._build_page_templates, number=1, repeat=self.REPEAT))
+
+        print(f'\nhrefs per page of {self.PAGE_SIZE}: '
+              f'reverse() {reverse_time * 1000:.3f} ms, '
+              f'templates {template_time * 1000:.3f} ms')
@@ -0,0 +1,27 @@
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from galaxy_ng.app.common import cache
+
+
+@override_settings(GALAXY_CACHE_BACKEND='lru')
+@mock.patch.object(time, 'time_ns', create=True, side_effect=AttributeError)
+class TestContentVersion(SimpleTestCase):
+    """Test content versions work without time.time_ns() of python 3.7+."""
+
+    def setUp(self):
+        cache.get_cache().clear()
+
+    def test_get_version(self, time_ns):
+        version = cache.get_version('test')
+        self.assertIsInstance(version, int)
+        self.assertEqual(cache.get_version('test'), version)
+        time_ns.assert_not_called()
+
+    def test_bump_version(self, time_ns):
+        version = cache.get_version('test')
+        cache.bump_version('test')
+        self.assertGreater(cache.get_version('test'), version)
+        time_ns.assert_not_called()
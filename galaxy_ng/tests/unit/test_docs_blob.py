@@ -0,0 +1,42 @@
+import json
+
+from django.test import SimpleTestCase
+
+from galaxy_ng.app.api.ui.viewsets.collection import _find_docs_blob
+
+
+class TestFindDocsBlob(SimpleTestCase):
+    """Test docs_blob is cut out of pulp response body regardless of layout."""
+
+    DOCS_BLOB = {
+        'collection_readme': {'html': '<p>{"docs_blob": []}</p>'},
+        'contents': [{'name': 'a]}"{', 'doc': '\\"]'}],
+    }
+
+    def assert_docs_blob(self, separators):
+        body = json.dumps({'count': 1, 'results': [{
+            'namespace': 'ns',
+            'description': '"docs_blob": [',
+            'docs_blob': self.DOCS_BLOB,
+            'version': '1.0.0',
+        }]}, separators=separators).encode()
+
+        start, end = _find_docs_blob(body)
+
+        self.assertEqual(json.loads(body[start:end]), self.DOCS_BLOB)
+        self.assertEqual(json.loads(body[:start] + b'null' + body[end:])['results'][0], {
+            'namespace': 'ns',
+            'description': '"docs_blob": [',
+            'docs_blob': None,
+            'version': '1.0.0',
+        })
+
+    def test_compact(self):
+        self.assert_docs_blob((',', ':'))
+
+    def test_spaced(self):
+        self.assert_docs_blob((', ', ': '))
+
+    def test_null(self):
+        self.assertIsNone(_find_docs_blob(b'{"results":[{"docs_blob":null}]}'))
+        self.assertIsNone(_find_docs_blob(b'{"results":[]}'))
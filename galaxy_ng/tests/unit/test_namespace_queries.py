@@ -0,0 +1,157 @@
+import collections
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from galaxy_ng.app.models import Group, Namespace, User
+from galaxy_ng.app.models.auth import RH_PARTNER_ENGINEER_GROUP
+
+
+class TestNamespaceQueries(TestCase):
+    """Test namespace endpoints run a constant number of queries."""
+
+    def setUp(self):
+        self.user = User.objects.create(username='test')
+        self.groups = [
+            Group.objects.create_identity('rh-identity-account', '1000'),
+            Group.objects.create_identity('rh-identity-account', '1001'),
+        ]
+        self.user.groups.add(*self.groups)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _create_namespaces(self, start, count, links=2):
+        for idx in range(start, start + count):
+            namespace = Namespace.objects.create(name=f'namespace_{idx}')
+            namespace.groups.add(*self.groups)
+            namespace.set_links([
+                {'name': f'link_{link_idx}', 'url': f'https://example.com/{link_idx}'}
+                for link_idx in range(links)
+            ])
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response.data
+
+    def assert_list_queries_constant(self, url):
+        self._create_namespaces(0, 2)
+        expected, _ = self._count_queries(url)
+
+        self._create_namespaces(2, 8)
+        num_queries, data = self._count_queries(url)
+
+        self.assertEqual(num_queries, expected)
+        self.assertEqual(data['meta']['count'], 10)
+        self.assertEqual(len(data['data']), 10)
+
+    def test_namespace_list(self):
+        self.assert_list_queries_constant(reverse('galaxy:api:ui:namespaces-list'))
+
+    def test_my_namespace_list(self):
+        self.assert_list_queries_constant(reverse('galaxy:api:ui:my-namespaces-list'))
+
+    def test_namespace_detail(self):
+        self._create_namespaces(0, 1, links=1)
+        expected, _ = self._count_queries(
+            reverse('galaxy:api:ui:namespaces-detail', kwargs={'name': 'namespace_0'}))
+
+        self._create_namespaces(1, 1, links=10)
+        num_queries, data = self._count_queries(
+            reverse('galaxy:api:ui:namespaces-detail', kwargs={'name': 'namespace_1'}))
+
+        self.assertEqual(num_queries, expected)
+        self.assertEqual(len(data['links']), 10)
+        self.assertEqual(len(data['groups']), 2)
+
+
+def count_writes(context):
+    """Returns numbers of INSERT, UPDATE and DELETE statements captured."""
+    statements = (query['sql'].split(None, 1)[0].upper() for query in context.captured_queries)
+    return collections.Counter(
+        statement for statement in statements if statement in ('INSERT', 'UPDATE', 'DELETE'))
+
+
+class TestNamespaceUpdateQueries(TestCase):
+    """Test namespace updates write only what has changed."""
+
+    LINKS = [
+        {'name': 'keep', 'url': 'https://example.com/keep'},
+        {'name': 'change', 'url': 'https://example.com/change'},
+    ]
+
+    def setUp(self):
+        self.user = User.objects.create(username='test')
+        self.group = Group.objects.create(name=RH_PARTNER_ENGINEER_GROUP)
+        self.user.groups.add(self.group)
+
+        self.namespace = Namespace.objects.create(
+            name='namespace', company='Company', description='Description')
+        self.namespace.groups.add(self.group)
+        self.namespace.set_links(self.LINKS)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _get_links(self):
+        return sorted(self.namespace.links.values_list('name', 'url'))
+
+    def test_identical_update_writes_nothing(self):
+        url = reverse('galaxy:api:ui:namespaces-detail', kwargs={'name': 'namespace'})
+        data = self.client.get(url).data
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.put(url, data, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(count_writes(context), {})
+        self.assertEqual(response.data['links'], data['links'])
+        self.assertEqual(response.data['groups'], [RH_PARTNER_ENGINEER_GROUP])
+
+    def test_set_links_identical(self):
+        with CaptureQueriesContext(connection) as context:
+            self.namespace.set_links(self.LINKS)
+
+        self.assertEqual(count_writes(context), {})
+
+    def test_set_links_change_and_remove(self):
+        self.namespace.set_links(self.LINKS + [
+            {'name': 'remove', 'url': 'https://example.com/remove'},
+        ])
+        kept = self.namespace.links.get(name='keep').pk
+
+        with CaptureQueriesContext(connection) as context:
+            self.namespace.set_links([
+                {'name': 'keep', 'url': 'https://example.com/keep'},
+                {'name': 'changed', 'url': 'https://example.com/changed'},
+            ])
+
+        self.assertEqual(count_writes(context), {'UPDATE': 1, 'DELETE': 1})
+        self.assertEqual(self._get_links(), [
+            ('changed', 'https://example.com/changed'),
+            ('keep', 'https://example.com/keep'),
+        ])
+        self.assertEqual(self.namespace.links.get(name='keep').pk, kept)
+
+    def test_set_links_change_and_add(self):
+        kept = self.namespace.links.get(name='keep').pk
+
+        with CaptureQueriesContext(connection) as context:
+            self.namespace.set_links([
+                {'name': 'keep', 'url': 'https://example.com/keep'},
+                {'name': 'changed', 'url': 'https://example.com/changed'},
+                {'name': 'add', 'url': 'https://example.com/add'},
+            ])
+
+        self.assertEqual(count_writes(context), {'UPDATE': 1, 'INSERT': 1})
+        self.assertEqual(self._get_links(), [
+            ('add', 'https://example.com/add'),
+            ('changed', 'https://example.com/changed'),
+            ('keep', 'https://example.com/keep'),
+        ])
+        self.assertEqual(self.namespace.links.get(name='keep').pk, kept)
@@ -0,0 +1,33 @@
+import socket
+import time
+
+from django.test import SimpleTestCase, override_settings
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+
+from galaxy_ng.app.common import pulp
+
+
+class TestPulpClientTimeout(SimpleTestCase):
+    """Test pulp API client requests time out."""
+
+    def setUp(self):
+        # NOTE: Connections are completed by the kernel backlog, but no
+        # response is ever sent.
+        self.server = socket.socket()
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(8)
+        self.addCleanup(self.server.close)
+
+    def test_read_timeout(self):
+        with override_settings(
+            X_PULP_API_HOST='127.0.0.1',
+            X_PULP_API_PORT=self.server.getsockname()[1],
+            X_PULP_API_READ_TIMEOUT=0.1,
+        ):
+            client = pulp._create_client()
+            start = time.monotonic()
+            with self.assertRaises(MaxRetryError) as context:
+                client.rest_client.GET(f'{client.configuration.host}/')
+
+        self.assertIsInstance(context.exception.reason, ReadTimeoutError)
+        self.assertLess(time.monotonic() - start, 5)
@@ -0,0 +1,44 @@
+from django.test import SimpleTestCase
+from django.urls import reverse, set_script_prefix
+
+from galaxy_ng.app.api import url_builder
+
+
+class TestUrlBuilder(SimpleTestCase):
+    """Test URL templates are equivalent to reverse()."""
+
+    VALUES = [
+        ('ansible', 'posix', '1.0.0'),
+        ('my_ns', 'my_collection', '1.0.0-beta.1+build.5'),
+        ('ns', 'name with space', '2.0.0'),
+        ('ns%', 'na:me@', '1.0.0~rc'),
+    ]
+
+    def tearDown(self):
+        set_script_prefix('/')
+
+    def assert_equivalent(self):
+        for namespace, name, version in self.VALUES:
+            self.assertEqual(
+                url_builder.collection_href(namespace, name),
+                reverse('galaxy:api:v3:collection',
+                        kwargs=dict(namespace=namespace, name=name)),
+            )
+            self.assertEqual(
+                url_builder.collection_versions_href(namespace, name),
+                reverse('galaxy:api:v3:collection-version-list',
+                        kwargs=dict(namespace=namespace, name=name)),
+            )
+            self.assertEqual(
+                url_builder.collection_version_href(namespace, name, version),
+                reverse('galaxy:api:v3:collection-version',
+                        kwargs=dict(namespace=namespace, name=name, version=version)),
+            )
+
+    def test_equivalent_to_reverse(self):
+        self.assert_equivalent()
+
+    def test_script_prefix(self):
+        url_builder.collection_href('ansible', 'posix')
+        set_script_prefix('/galaxy/')
+        self.assert_equivalent()